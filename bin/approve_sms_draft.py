@@ -36,6 +36,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    # Parser construction dominates wrapper startup for repeat in-process
+    # callers (tests, future batch drivers); build it once per module.
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 def require_approval_token(provided_token: str | None) -> None:
     expected_token = os.environ.get("DIALPAD_SMS_APPROVAL_TOKEN")
     if not expected_token:
@@ -54,7 +66,7 @@ def main() -> int:
     wrapper = "approve_sms_draft.py"
 
     try:
-        args = build_parser().parse_args()
+        args = _get_parser().parse_args()
         json_mode = args.json
         require_approval_token(args.approval_token)
         conn = init_db()
@@ -51,6 +51,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    # Parser construction dominates wrapper startup for repeat in-process
+    # callers (tests, future batch drivers); build it once per module.
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 
 def validate_events(events: str | None) -> None:
     if not events:
@@ -175,7 +187,7 @@ def main() -> int:
     command_key = "create_sms_webhook.create"
 
     try:
-        args = build_parser().parse_args()
+        args = _get_parser().parse_args()
         json_mode = bool(getattr(args, "json", False))
         if args.command == "list":
             command_key = "create_sms_webhook.list"
@@ -37,6 +37,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    # Parser construction dominates wrapper startup for repeat in-process
+    # callers (tests, future batch drivers); build it once per module.
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 
 def parse_iso_date(value: str | None) -> date | None:
     if not value:
@@ -144,7 +156,7 @@ def main() -> int:
     wrapper = "export_sms.py"
 
     try:
-        args = build_parser().parse_args()
+        args = _get_parser().parse_args()
         json_mode = args.json
         require_generated_cli()
         require_api_key()
@@ -55,6 +55,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    # Parser construction dominates wrapper startup for repeat in-process
+    # callers (tests, future batch drivers); build it once per module.
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 def _validate_args(args: argparse.Namespace) -> None:
     if args.with_value and not args.last:
         raise WrapperError("--with can only be used with --last", code="invalid_argument", retryable=False)
@@ -79,7 +91,7 @@ def main() -> int:
     wrapper = "get_call_transcript.py"
 
     try:
-        args = build_parser().parse_args()
+        args = _get_parser().parse_args()
         json_mode = args.json
         _validate_args(args)
 
@@ -71,6 +71,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    # Parser construction dominates wrapper startup for repeat in-process
+    # callers (tests, future batch drivers); build it once per module.
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 def _validated_positive_int(value: int, flag: str) -> int:
     if value <= 0:
         raise WrapperError(f"{flag} must be greater than 0", code="invalid_argument", retryable=False)
@@ -83,7 +95,7 @@ def main() -> int:
     wrapper = "list_calls.py"
 
     try:
-        args = build_parser().parse_args()
+        args = _get_parser().parse_args()
         json_mode = args.json
         limit = _validated_positive_int(args.limit, "--limit")
         hours = None if args.today else _validated_positive_int(args.hours, "--hours")
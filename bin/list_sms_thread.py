@@ -34,6 +34,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    # Parser construction dominates wrapper startup for repeat in-process
+    # callers (tests, future batch drivers); build it once per module.
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 def _validate_limit(value: int) -> int:
     if value <= 0:
         raise WrapperError("--limit must be greater than 0", code="invalid_argument", retryable=False)
@@ -112,7 +124,7 @@ def main() -> int:
     wrapper = "list_sms_thread.py"
 
     try:
-        args = build_parser().parse_args()
+        args = _get_parser().parse_args()
         json_mode = args.json
         limit = _validate_limit(args.limit)
         phone = args.phone.strip()
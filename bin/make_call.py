@@ -61,6 +61,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    # Parser construction dominates wrapper startup for repeat in-process
+    # callers (tests, future batch drivers); build it once per module.
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 
 def resolve_user_id(from_number: str | None, explicit_user_id: str | None) -> str:
     if explicit_user_id:
@@ -82,7 +94,7 @@ def main() -> int:
     wrapper = "make_call.py"
 
     try:
-        args = build_parser().parse_args()
+        args = _get_parser().parse_args()
         json_mode = args.json
         try:
             require_supported_outbound_destinations((args.to,))
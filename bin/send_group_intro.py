@@ -53,6 +53,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    # Parser construction dominates wrapper startup for repeat in-process
+    # callers (tests, future batch drivers); build it once per module.
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 def _label_for_party(name: str | None, fallback: str) -> str:
     return name.strip() if name and name.strip() else fallback
 
@@ -98,7 +110,7 @@ def main() -> int:
     wrapper = "send_group_intro.py"
     json_mode = "--json" in sys.argv
     try:
-        args = build_parser().parse_args()
+        args = _get_parser().parse_args()
         json_mode = args.json
         if not args.confirm_share:
             raise WrapperError(
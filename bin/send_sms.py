@@ -78,6 +78,18 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_PARSER = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    # Parser construction dominates wrapper startup for repeat in-process
+    # callers (tests, future batch drivers); build it once per module.
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 def resolve_message_text(args: argparse.Namespace) -> tuple[str, str]:
     if args.message is not None:
         message_text = args.message
@@ -351,7 +363,7 @@ def main() -> int:
     wrapper = "send_sms.py"
 
     try:
-        args = build_parser().parse_args()
+        args = _get_parser().parse_args()
         json_mode = args.json
         try:
             args.to = normalize_supported_outbound_destinations(
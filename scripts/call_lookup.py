@@ -33,7 +33,11 @@ def require_api_key() -> str:
     return api_key
 
 
-def api_get(path: str, query: dict[str, Any] | None = None) -> dict[str, Any]:
+def api_get(
+    path: str,
+    query: dict[str, Any] | None = None,
+    timeout: float | None = None,
+) -> dict[str, Any]:
     api_key = require_api_key()
     url = f"{DIALPAD_API_BASE}{path}"
     if query:
@@ -51,7 +55,7 @@ def api_get(path: str, query: dict[str, Any] | None = None) -> dict[str, Any]:
     )
 
     try:
-        with urllib.request.urlopen(req) as resp:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
             data = resp.read().decode("utf-8")
             return json.loads(data) if data else {}
     except urllib.error.HTTPError as exc:
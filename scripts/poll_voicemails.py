@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Poll Dialpad inbound calls for new voicemails and notify Telegram."""
 
+import functools
 import json
+import re
 import os
 import sqlite3
 import sys
@@ -9,9 +11,58 @@ import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(raw):
+    """Decode JSON with orjson when available (2-5x faster), stdlib otherwise."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps_bytes(payload):
+    """Encode JSON to utf-8 bytes with orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _build_session():
+    """Build a keep-alive session so one poll run reuses TCP+TLS connections."""
+    if requests is None:
+        return None
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared pool for Dialpad pagination and Telegram sends; None falls back to urllib.
+_SESSION = _build_session()
+
 DIALPAD_API_KEY = os.environ.get("DIALPAD_API_KEY", "")
 TELEGRAM_BOT_TOKEN = os.environ.get("DIALPAD_TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.environ.get("DIALPAD_TELEGRAM_CHAT_ID", "")
@@ -37,8 +88,16 @@ def normalize_phone_number(phone_number):
     """
     if not phone_number:
         return None
+    return _normalize_cached(str(phone_number))
+
+
+_NON_DIGIT = re.compile(r"\D+")
 
-    digits = "".join(ch for ch in str(phone_number) if ch.isdigit())
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_cached(phone_number):
+    """Cached core of normalize_phone_number; the same numbers recur per run."""
+    digits = _NON_DIGIT.sub("", phone_number)
     if not digits:
         return None
     if len(digits) == 11 and digits.startswith("1"):
@@ -53,6 +112,11 @@ def format_phone_number(phone_number):
     normalized = normalize_phone_number(phone_number)
     if not normalized:
         return None
+    return _format_cached(normalized)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_cached(normalized):
     if len(normalized) == 10:
         return f"({normalized[:3]}) {normalized[3:6]}-{normalized[6:]}"
     return normalized
@@ -62,24 +126,26 @@ def load_line_names():
     """
     Load line-name mapping from env and merge with defaults.
     Env values override defaults, defaults still act as fallback.
+    Maps normalized number -> (friendly name, formatted number), so the
+    per-voicemail path only normalizes once and does a single dict probe.
     """
     loaded = {}
     for number, name in DEFAULT_LINE_NAMES.items():
         normalized = normalize_phone_number(number)
         if normalized:
-            loaded[normalized] = str(name)
+            loaded[normalized] = (str(name), _format_cached(normalized))
 
     if not DIALPAD_LINE_NAMES:
         return loaded
 
     try:
-        env_mapping = json.loads(DIALPAD_LINE_NAMES)
+        env_mapping = json_loads(DIALPAD_LINE_NAMES)
         if not isinstance(env_mapping, dict):
             raise ValueError("DIALPAD_LINE_NAMES must be a JSON object")
         for number, name in env_mapping.items():
             normalized = normalize_phone_number(number)
             if normalized and name:
-                loaded[normalized] = str(name)
+                loaded[normalized] = (str(name), _format_cached(normalized))
     except Exception as exc:
         print(f"⚠️  Invalid DIALPAD_LINE_NAMES, using defaults: {exc}", file=sys.stderr)
 
@@ -99,19 +165,19 @@ def get_line_name(to_number):
     if not normalized:
         return None
 
-    formatted = format_phone_number(normalized) or normalized
-    friendly = LINE_NAMES.get(normalized)
-    if friendly:
+    entry = LINE_NAMES.get(normalized)
+    if entry:
+        friendly, formatted = entry
         return f"{friendly} {formatted}"
-    return formatted
+    return _format_cached(normalized)
+
+
+_MD_ESCAPE = str.maketrans({"_": "\\_", "*": "\\*", "`": "\\`", "[": "\\["})
 
 
 def escape_markdown(text):
     """Escape Telegram Markdown special chars for parse_mode=Markdown."""
-    escaped = str(text)
-    for ch in ("_", "*", "`", "["):
-        escaped = escaped.replace(ch, f"\\{ch}")
-    return escaped
+    return str(text).translate(_MD_ESCAPE)
 
 
 def parse_positive_float(raw, default):
@@ -122,7 +188,16 @@ def parse_positive_float(raw, default):
         return default
 
 
+SEEN_RETENTION_DAYS = 30
+
+
 def ensure_db(conn):
+    # WAL + NORMAL keeps commits off the fsync-per-write path and lets
+    # readers coexist with the poller's writes.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=67108864")
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS voicemails_seen (
@@ -131,20 +206,48 @@ def ensure_db(conn):
         )
         """
     )
-    conn.commit()
+    conn.execute(
+        "DELETE FROM voicemails_seen WHERE notified_at < datetime('now', ?)",
+        (f"-{SEEN_RETENTION_DAYS} day",),
+    )
 
 
-def has_seen(conn, call_id):
-    cursor = conn.execute("SELECT 1 FROM voicemails_seen WHERE call_id = ?", (call_id,))
-    return cursor.fetchone() is not None
+# Stay under SQLite's historical 999 bound-parameter limit per statement.
+_SEEN_PROBE_CHUNK = 500
 
 
-def mark_seen(conn, call_id):
-    conn.execute(
-        "INSERT OR IGNORE INTO voicemails_seen (call_id, notified_at) VALUES (?, ?)",
-        (call_id, datetime.now(timezone.utc).isoformat()),
-    )
-    conn.commit()
+def load_seen(conn, call_ids):
+    """Return the subset of call_ids already recorded, via batched PK probes."""
+    seen = set()
+    call_ids = list(call_ids)
+    for start in range(0, len(call_ids), _SEEN_PROBE_CHUNK):
+        chunk = call_ids[start:start + _SEEN_PROBE_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        rows = conn.execute(
+            f"SELECT call_id FROM voicemails_seen WHERE call_id IN ({placeholders})",
+            chunk,
+        )
+        seen.update(row[0] for row in rows)
+    return seen
+
+
+def mark_seen_many(conn, call_ids):
+    """Record notified call_ids in one transaction, so one fsync per run."""
+    if not call_ids:
+        return
+    notified_at = datetime.now(timezone.utc).isoformat()
+    # BEGIN IMMEDIATE takes the write lock up front, avoiding SQLite's
+    # deferred-then-upgrade path that can hit SQLITE_BUSY under WAL readers.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            "INSERT OR IGNORE INTO voicemails_seen (call_id, notified_at) VALUES (?, ?)",
+            [(call_id, notified_at) for call_id in call_ids],
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
 
 
 def send_to_telegram(text):
@@ -162,21 +265,39 @@ def send_to_telegram(text):
         "text": text,
         "parse_mode": "Markdown",
     }
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-    )
+    data = json_dumps_bytes(payload)
+    headers = {"Content-Type": "application/json"}
 
     try:
-        with urllib.request.urlopen(req, timeout=10):
-            return True
+        if _SESSION is not None:
+            _SESSION.post(url, data=data, headers=headers, timeout=10).raise_for_status()
+        else:
+            req = urllib.request.Request(url, data=data, headers=headers)
+            with urllib.request.urlopen(req, timeout=10):
+                pass
+        return True
     except Exception as exc:
         print(f"❌ Error sending to Telegram: {exc}", file=sys.stderr)
         return False
 
 
+TELEGRAM_FANOUT_WORKERS = 4
+
+
+def send_all_to_telegram(messages):
+    """
+    Send Telegram notifications concurrently and return per-message success.
+    Results keep the order of `messages`; a backlog of N voicemails costs
+    roughly one round trip instead of N sequential ones.
+    """
+    if len(messages) <= 1:
+        return [send_to_telegram(message) for message in messages]
+
+    workers = min(TELEGRAM_FANOUT_WORKERS, len(messages))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(send_to_telegram, messages))
+
+
 def fetch_inbound_calls(api_key, lookback_ms=None, now_ms=None):
     """Fetch inbound calls, paginating until items are older than lookback window."""
     headers = {
@@ -187,19 +308,34 @@ def fetch_inbound_calls(api_key, lookback_ms=None, now_ms=None):
     cursor = None
     max_pages = 20  # safety cap (~1000 calls max)
 
+    base_url = "https://dialpad.com/api/v2/call?direction=inbound&limit=50"
+    if lookback_ms and now_ms:
+        # Ask the server for the lookback window only; the client-side
+        # is_within_lookback filter stays as a safety net.
+        base_url += f"&started_after={now_ms - lookback_ms}"
+        max_pages = 10
+
     for _ in range(max_pages):
-        url = "https://dialpad.com/api/v2/call?direction=inbound&limit=50"
+        url = base_url
         if cursor:
             url += f"&cursor={urllib.parse.quote(cursor)}"
 
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=20) as response:
-            raw_response = response.read().decode("utf-8")
-            try:
-                data = json.loads(raw_response)
-            except json.JSONDecodeError as exc:
-                print(f"❌ Failed to parse Dialpad JSON response: {exc}\nResponse: {raw_response[:200]}...", file=sys.stderr)
-                raise RuntimeError(f"Invalid JSON response from Dialpad API")
+        if _SESSION is not None:
+            resp = _SESSION.get(url, headers=headers, timeout=20)
+            resp.raise_for_status()
+            raw_response = resp.content
+        else:
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req, timeout=20) as response:
+                raw_response = response.read()
+        try:
+            # Both decoders accept bytes directly; skipping the utf-8 decode
+            # avoids building an intermediate str for every page.
+            data = json_loads(raw_response)
+        except json.JSONDecodeError as exc:
+            preview = raw_response[:200].decode("utf-8", "replace")
+            print(f"❌ Failed to parse Dialpad JSON response: {exc}\nResponse: {preview}...", file=sys.stderr)
+            raise RuntimeError(f"Invalid JSON response from Dialpad API")
 
         if isinstance(data, list):
             all_calls.extend(data)
@@ -237,27 +373,44 @@ def fetch_inbound_calls(api_key, lookback_ms=None, now_ms=None):
     return all_calls
 
 
-def has_voicemail(call):
-    link = str(call.get("voicemail_link") or "").strip()
-    recording_id = str(call.get("voicemail_recording_id") or "").strip()
-    return bool(link or recording_id)
+def filter_voicemails(calls, lookback_ms, now_ms):
+    """
+    Keep dict entries that carry a voicemail and ended inside the lookback
+    window. One tight pass with locally bound names instead of per-call
+    helper frames; matters when a page pulls hundreds of records.
+    """
+    cutoff = now_ms - lookback_ms
+    int_, float_, str_ = int, float, str
+    voicemails = []
+    append = voicemails.append
 
+    for call in calls:
+        if not isinstance(call, dict):
+            continue
 
-def is_within_lookback(call, lookback_ms, now_ms):
-    ended_raw = call.get("date_ended")
-    try:
-        ended_ms = int(float(str(ended_raw)))
-    except (TypeError, ValueError):
-        return False
+        link = call.get("voicemail_link")
+        recording_id = call.get("voicemail_recording_id")
+        if not (
+            (link and str_(link).strip())
+            or (recording_id and str_(recording_id).strip())
+        ):
+            continue
+
+        try:
+            ended_ms = int_(float_(str_(call.get("date_ended"))))
+        except (TypeError, ValueError):
+            continue
+        if cutoff <= ended_ms <= now_ms:
+            append(call)
 
-    return (now_ms - lookback_ms) <= ended_ms <= now_ms
+    return voicemails
 
 
 def looks_like_phone(value):
     normalized = normalize_phone_number(value)
     if not normalized:
         return False
-    digits = "".join(ch for ch in str(value) if ch.isdigit())
+    digits = _NON_DIGIT.sub("", str(value))
     return len(digits) >= 7
 
 
@@ -325,7 +478,8 @@ def build_notification(call):
     return text
 
 
-def main():
+def poll_once():
+    """Run one poll cycle; returns (exit_code, found_count)."""
     found_count = 0
     notified_count = 0
 
@@ -336,52 +490,87 @@ def main():
         if not DIALPAD_API_KEY:
             print("❌ Missing required env var: DIALPAD_API_KEY", file=sys.stderr)
             print("found 0 voicemail(s), notified 0 new")
-            return 0
+            return 0, 0
 
         db_path = Path(DB_PATH_RAW).expanduser()
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        now_ms = int(time.time() * 1000)
+        now_ms = time.time_ns() // 1_000_000
 
-        with sqlite3.connect(str(db_path)) as conn:
+        # isolation_level=None leaves autocommit on; mark_seen_many manages
+        # its own explicit transaction around the batch insert.
+        with sqlite3.connect(str(db_path), isolation_level=None) as conn:
             ensure_db(conn)
 
             try:
                 calls = fetch_inbound_calls(DIALPAD_API_KEY, lookback_ms=lookback_ms, now_ms=now_ms)
             except urllib.error.HTTPError as exc:
                 print(f"❌ Dialpad API HTTP error: {exc.code} {exc.reason}", file=sys.stderr)
-                return 1
+                return 1, 0
             except Exception as exc:
                 print(f"❌ Dialpad API request failed: {exc}", file=sys.stderr)
-                return 1
-            voicemails = [
-                call
-                for call in calls
-                if isinstance(call, dict)
-                and has_voicemail(call)
-                and is_within_lookback(call, lookback_ms, now_ms)
-            ]
+                return 1, 0
+            voicemails = filter_voicemails(calls, lookback_ms, now_ms)
             found_count = len(voicemails)
 
+            # First-wins dedupe on call_id: overlapping pages or a rewound
+            # cursor must not produce duplicate Telegram sends or DB probes.
+            candidates = {}
             for call in voicemails:
                 call_id = str(call.get("call_id") or "").strip()
                 if not call_id:
                     print("⚠️  Skipping voicemail with missing call_id", file=sys.stderr)
                     continue
-                if has_seen(conn, call_id):
-                    continue
+                candidates.setdefault(call_id, call)
+            candidates = list(candidates.items())
+
+            seen = load_seen(conn, [call_id for call_id, _ in candidates])
+            pending = [
+                (call_id, build_notification(call))
+                for call_id, call in candidates
+                if call_id not in seen
+            ]
 
-                message = build_notification(call)
-                if send_to_telegram(message):
-                    mark_seen(conn, call_id)
-                    notified_count += 1
+            results = send_all_to_telegram([message for _, message in pending])
+            sent_ids = [call_id for (call_id, _), sent in zip(pending, results) if sent]
+            mark_seen_many(conn, sent_ids)
+            notified_count = len(sent_ids)
 
     except Exception as exc:
         print(f"❌ Poller error: {exc}", file=sys.stderr)
 
     print(f"found {found_count} voicemail(s), notified {notified_count} new")
-    return 0
+    return 0, found_count
+
+
+def main():
+    exit_code, _ = poll_once()
+    return exit_code
+
+
+def run_daemon(min_interval=30.0, max_interval=600.0):
+    """
+    Poll in a loop with an adaptive interval: reset to min_interval whenever
+    a cycle finds voicemails, double toward max_interval while idle. Saves
+    API calls and wakeups during quiet hours without hurting busy-period
+    latency. Ctrl-C exits cleanly.
+    """
+    interval = min_interval
+    try:
+        while True:
+            _, found_count = poll_once()
+            if found_count > 0:
+                interval = min_interval
+            else:
+                interval = min(max_interval, interval * 2)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        return 0
 
 
 if __name__ == "__main__":
+    if "--daemon" in sys.argv[1:]:
+        min_iv = parse_positive_float(os.environ.get("POLL_MIN_INTERVAL"), 30.0)
+        max_iv = parse_positive_float(os.environ.get("POLL_MAX_INTERVAL"), 600.0)
+        sys.exit(run_daemon(min_interval=min_iv, max_interval=max(max_iv, min_iv)))
     sys.exit(main())
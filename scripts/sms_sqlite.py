@@ -16,23 +16,31 @@ try:
         filter_messages as _security_filter_messages,
         redact_preview as _security_redact_preview,
     )
+    FILTER_AVAILABLE = True
 except ImportError:
     _security_filter_messages = None
     _security_redact_preview = None
+    FILTER_AVAILABLE = False
 
 
-def filter_messages(messages, **kwargs):
-    """Optional filtering: use sms_security_filter when installed, else no-op."""
-    if _security_filter_messages:
+# Availability is fixed at import, so bind the right implementation once
+# instead of re-testing the optional module on every call.
+if FILTER_AVAILABLE:
+    def filter_messages(messages, **kwargs):
+        """Optional filtering via sms_security_filter."""
         return _security_filter_messages(messages, **kwargs)
-    return messages
 
-
-def redact_preview(text, **kwargs):
-    """Optional redaction: use sms_security_filter when installed, else no-op."""
-    if _security_redact_preview:
+    def redact_preview(text, **kwargs):
+        """Optional redaction via sms_security_filter."""
         return _security_redact_preview(text, **kwargs)
-    return text
+else:
+    def filter_messages(messages, **_kwargs):
+        """sms_security_filter not installed: identity pass-through."""
+        return messages
+
+    def redact_preview(text, **_kwargs):
+        """sms_security_filter not installed: identity pass-through."""
+        return text
 
 # Database path
 def resolve_db_path() -> Path:
@@ -53,6 +61,14 @@ def init_db() -> sqlite3.Connection:
         conn.execute("PRAGMA journal_mode=WAL")  # best-effort; busy_timeout provides the serialization
     except sqlite3.OperationalError:
         pass
+    # With WAL, NORMAL syncs on checkpoint instead of per-commit, cutting an
+    # fsync from every stored message; a crash can lose at most the last
+    # commits, never corrupt the database.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # FTS5 merges spill sort data to temp storage; keep that in memory, and
+    # mmap the main file so reads share the page cache across processes.
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB cap, not a reservation
     conn.row_factory = sqlite3.Row
     
     # Main messages table
@@ -307,11 +323,18 @@ def get_all_threads(conn: sqlite3.Connection) -> List[dict]:
 
 
 def search_messages(conn: sqlite3.Connection, query: str, limit: int = 20) -> List[dict]:
-    """Full-text search across all messages"""
+    """Full-text search across all messages.
+
+    The MATCH runs in its own CTE so the FTS5 index always drives the plan;
+    joining the virtual table directly lets the planner fall back to a
+    virtual-table scan when it picks the messages side first.
+    """
     cursor = conn.execute(
-        """SELECT m.* FROM messages m
-           JOIN messages_fts fts ON m.id = fts.rowid
-           WHERE messages_fts MATCH ?
+        """WITH fts_hits AS (
+               SELECT rowid FROM messages_fts WHERE messages_fts MATCH ?
+           )
+           SELECT m.* FROM messages m
+           JOIN fts_hits ON m.id = fts_hits.rowid
            ORDER BY m.timestamp DESC
            LIMIT ?""",
         (query, limit)
@@ -43,6 +43,7 @@ import sys
 import time
 import hmac
 import hashlib
+import functools
 import base64
 import binascii
 import re
@@ -63,7 +64,7 @@ skill_dir = Path(__file__).parent
 sys.path.insert(0, str(skill_dir))
 
 # Import existing SQLite storage handler
-from webhook_sqlite import handle_sms_webhook
+from webhook_sqlite import handle_sms_webhook, lookup_contact_name as lookup_stored_contact_name
 import draft_model
 try:
     from sms_sqlite import init_db as init_sms_history_db
@@ -79,6 +80,41 @@ try:
 except Exception:
     sms_approval = None
 
+# Optional RE2 engine for the sensitive-message prefilter. RE2 compiles to a
+# linear-time DFA, so the unanchored alternation with .{0,80} windows cannot
+# backtrack pathologically on adversarial SMS text; stdlib re is the fallback.
+try:
+    import re2 as _prefilter_re
+except ImportError:
+    _prefilter_re = re
+
+# Optional orjson for webhook body parsing. It parses bytes directly,
+# several times faster than stdlib json, and its JSONDecodeError subclasses
+# the stdlib one, so existing except clauses keep working unchanged.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(raw_body):
+    """Parse JSON from bytes or str via orjson when available."""
+    if _orjson is not None:
+        return _orjson.loads(raw_body)
+    return json.loads(raw_body)
+
+
+def _json_dumps_bytes(payload):
+    """Serialize payload to UTF-8 JSON bytes via orjson when available.
+
+    orjson returns bytes directly, skipping the str round-trip plus
+    .encode() that stdlib json.dumps pays on every outbound request body
+    and HTTP response write.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
 # Attio client for the S5 person-timeline note write-back. Optional + guarded so a
 # missing adapter never breaks import; the write path treats a None client as
 # "disabled" and writes nothing.
@@ -158,6 +194,8 @@ DIALPAD_ATTIO_NOTE_WRITEBACK_ENABLED = parse_bool_env(
     os.environ.get("DIALPAD_ATTIO_NOTE_WRITEBACK_ENABLED"), False
 )
 DIALPAD_RICH_SMS_DRAFTS_ENABLED = parse_bool_env(os.environ.get("DIALPAD_RICH_SMS_DRAFTS_ENABLED"), True)
+# Default ON: outbound rows feed delivery receipts and recent-reply context.
+DIALPAD_STORE_OUTBOUND = parse_bool_env(os.environ.get("DIALPAD_STORE_OUTBOUND"), True)
 # S4 SHADOW MODE: rich-reply categories (build_rich_sms_reply's 'category' key)
 # that would be eligible for confidence-gated auto-send. The shadow classifier
 # only *computes and logs* this decision for S6 evaluation; it is NEVER wired to a
@@ -207,6 +245,10 @@ DEFAULT_LINE_NAMES = {
 
 MISSED_CALL_STATES = {"missed", "no_answer", "unanswered"}
 MISSED_CALL_EVENT_HINTS = {"missed_call", "call.missed", "call_missed", "call missed"}
+# Precompiled alternations so hint detection walks the joined event text once
+# per check instead of once per hint substring.
+_MISSED_HINT_RE = re.compile("|".join(map(re.escape, sorted(MISSED_CALL_EVENT_HINTS))))
+_NO_ANSWER_RE = re.compile("no_answer|unanswered")
 CALL_CONTEXT_FIELDS = {
     "call_id",
     "call_missed",
@@ -286,8 +328,42 @@ SENSITIVE_KEYWORD_PATTERNS = (
 )
 
 CODE_TOKEN_PATTERN = re.compile(r"\b(?:\d[\s-]?){4,8}\b")
+SECURITY_CONTEXT_PATTERN = re.compile(
+    r"\b(verify|verification|security|login|signin|sign in|auth|account|bank|google|intuit)\b",
+    re.IGNORECASE,
+)
+
+# Fused alternation of every sensitive indicator (keyword patterns plus the
+# security-context words). One engine pass decides the common "nothing
+# sensitive here" case; only matches fall through to the precise per-pattern
+# logic in is_sensitive_message. Compiled with RE2 when installed (see the
+# _prefilter_re import) so the scan stays linear in the text length.
+_SENSITIVE_PREFILTER = _prefilter_re.compile(
+    "(?:"
+    + "|".join(pattern.pattern for pattern in SENSITIVE_KEYWORD_PATTERNS)
+    + "|"
+    + SECURITY_CONTEXT_PATTERN.pattern
+    + ")",
+    re.IGNORECASE,
+)
+_SENSITIVE_SEARCH = _SENSITIVE_PREFILTER.search
+
+# Cheapest gate first: every alternative in the prefilter regex contains at
+# least one of these substrings, so a message matching none of them cannot be
+# sensitive. str.__contains__ is a native scan — for the ~95% of SMS with no
+# sensitive indicator this settles the question without entering the regex
+# engine at all. Keep in sync with SENSITIVE_KEYWORD_PATTERNS and
+# SECURITY_CONTEXT_PATTERN when their vocabularies change.
+_SENSITIVE_HINTS = (
+    "otp", "o.t.p", "2fa", "factor", "mfa", "code", "pass", "verif",
+    "security", "login", "sign", "auth", "account", "bank", "google", "intuit",
+)
+
 CALLS_ENDPOINT = "https://dialpad.com/api/v2/call"
 
+# Cap request bodies to prevent memory exhaustion (shared by all POST handlers).
+MAX_BODY_SIZE = 1 << 20  # 1MB
+
 OPT_OUT_PATTERNS = (
     re.compile(r"^\s*(stop|stopall|unsubscribe|cancel|end|quit)\s*[.!]?\s*$", re.IGNORECASE),
     re.compile(r"\bstop\s+(texting|messaging|calling|contacting|reaching out|sending)\b", re.IGNORECASE),
@@ -309,15 +385,45 @@ def log_line(message):
     print(message, flush=True)
 
 
-def normalize_phone_number(phone_number):
-    """
-    Normalize a phone number to last 10 digits for reliable comparisons.
-    Removes non-digits, optional leading country code 1, and keeps last 10 digits.
+def _preview(text, limit):
+    """Truncate log/notification text to ``limit`` chars with an ellipsis."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+# [whole_seconds, rendered_iso] — mutated in place. Concurrent handler threads
+# may race on the update, but both writers produce the same second's string,
+# so the worst case is a redundant format, never a wrong timestamp.
+_TS_CACHE = [0, ""]
+
+
+def _iso_now():
+    """ISO timestamp for log lines, re-rendered at most once per second.
+
+    Log timestamps only need second resolution, so the strftime-equivalent
+    cost of datetime.now().isoformat() is paid once per second instead of
+    several times per webhook. Not for dedupe or ordering — those use
+    _now_ms().
     """
-    if not phone_number:
-        return None
+    now = time.time()
+    second = int(now)
+    if second != _TS_CACHE[0]:
+        _TS_CACHE[0] = second
+        _TS_CACHE[1] = datetime.fromtimestamp(now).isoformat(timespec="seconds")
+    return _TS_CACHE[1]
+
+
+_NON_DIGIT_RE = re.compile(r"\D+")
+
 
-    digits = "".join(ch for ch in str(phone_number) if ch.isdigit())
+@functools.lru_cache(maxsize=4096)
+def _normalize_digits(text):
+    """Cached digit extraction + country-code trim for a raw phone string.
+
+    Normalization runs several times per webhook over the same handful of
+    numbers; a C-level regex sub plus an LRU on the raw string replaces the
+    per-character Python generator the hot path used to pay.
+    """
+    digits = _NON_DIGIT_RE.sub("", text)
     if not digits:
         return None
     if len(digits) == 11 and digits.startswith("1"):
@@ -327,6 +433,16 @@ def normalize_phone_number(phone_number):
     return digits
 
 
+def normalize_phone_number(phone_number):
+    """
+    Normalize a phone number to last 10 digits for reliable comparisons.
+    Removes non-digits, optional leading country code 1, and keeps last 10 digits.
+    """
+    if not phone_number:
+        return None
+    return _normalize_digits(str(phone_number))
+
+
 DIALPAD_AUTO_REPLY_SALES_LINE = normalize_phone_number(
     os.environ.get("DIALPAD_AUTO_REPLY_SALES_LINE", "+14155201316")
 )
@@ -374,6 +490,14 @@ def load_line_names():
 
 LINE_NAMES = load_line_names()
 
+# Final display text per mapped line, precomputed once: the mapping is fixed
+# for the process lifetime, so the per-call normalize + format round-trip in
+# get_line_name collapses to a dict hit for known lines.
+LINE_DISPLAY = {
+    normalized: f"{friendly} {format_phone_number(normalized) or normalized}"
+    for normalized, friendly in LINE_NAMES.items()
+}
+
 
 def parse_priority_route_phones(raw_value):
     """Parse comma-separated E.164 phone list into normalized set."""
@@ -564,11 +688,10 @@ def get_line_name(to_number):
     if not normalized:
         return None
 
-    formatted = format_phone_number(normalized) or normalized
-    friendly = LINE_NAMES.get(normalized)
-    if friendly:
-        return f"{friendly} {formatted}"
-    return formatted
+    display = LINE_DISPLAY.get(normalized)
+    if display:
+        return display
+    return format_phone_number(normalized) or normalized
 
 
 def infer_line_display_from_payload(data):
@@ -717,11 +840,54 @@ def classify_contact_lookup_unauthorized(raw_body):
     return "unauthorized"
 
 
+# Bounded TTL cache for contact enrichment, keyed by normalized number. The
+# same handful of senders text repeatedly; re-querying Dialpad per message
+# costs a synchronous HTTPS round-trip (5s timeout) on the inbound path.
+# Only definitive outcomes (resolved / not_found) are cached — degraded and
+# error lookups always retry. Lock-guarded: handlers run on server threads.
+_CONTACT_CACHE = {}
+_CONTACT_CACHE_LOCK = threading.Lock()
+_CONTACT_CACHE_TTL_SECONDS = 3600
+# not_found entries expire sooner: an unknown number may be added to Dialpad
+# contacts at any time, so the negative answer goes stale much faster than a
+# resolved one.
+_CONTACT_CACHE_NEGATIVE_TTL_SECONDS = 300
+_CONTACT_CACHE_MAX_ENTRIES = 1024
+
+
 def lookup_contact_enrichment(phone_number):
     """
     Resolve sender enrichment from Dialpad contacts endpoint.
     Returns a dict with contact_name and explicit degraded-enrichment details.
+    Definitive results are served from a bounded TTL cache per sender.
     """
+    cache_key = normalize_phone_number(phone_number)
+    if cache_key:
+        now = time.time()
+        with _CONTACT_CACHE_LOCK:
+            entry = _CONTACT_CACHE.get(cache_key)
+            if entry:
+                ttl = (
+                    _CONTACT_CACHE_TTL_SECONDS
+                    if entry[1].get("status") == "resolved"
+                    else _CONTACT_CACHE_NEGATIVE_TTL_SECONDS
+                )
+                if now - entry[0] < ttl:
+                    # Copy: callers mutate the enrichment dict in place.
+                    return dict(entry[1])
+
+    result = _lookup_contact_enrichment_uncached(phone_number)
+
+    if cache_key and not result.get("degraded") and result.get("status") in ("resolved", "not_found"):
+        with _CONTACT_CACHE_LOCK:
+            if len(_CONTACT_CACHE) >= _CONTACT_CACHE_MAX_ENTRIES:
+                _CONTACT_CACHE.pop(next(iter(_CONTACT_CACHE)))
+            _CONTACT_CACHE[cache_key] = (time.time(), dict(result))
+    return result
+
+
+def _lookup_contact_enrichment_uncached(phone_number):
+    """Uncached Dialpad contacts lookup backing lookup_contact_enrichment."""
     result = {
         "contact_name": None,
         "first_name": None,
@@ -806,6 +972,10 @@ def extract_call_text(data):
 
 def is_blank_text(value):
     """True when text is empty or whitespace-only."""
+    if type(value) is str:
+        # The payload fields this guards are already str in practice;
+        # isspace() answers without the str()/strip() allocations.
+        return not value or value.isspace()
     return not str(value or "").strip()
 
 
@@ -828,18 +998,21 @@ def is_sensitive_message(text="", sender="", contact_number=""):
         part for part in (str(sender or ""), str(contact_number or ""), body) if part
     )
 
+    # Substring gate, then single fused scan: most messages carry no
+    # sensitive indicator at all, and both branches below require at least
+    # one prefilter alternative.
+    lowered = combined.lower()
+    if not any(hint in lowered for hint in _SENSITIVE_HINTS):
+        return False
+    if _SENSITIVE_SEARCH(combined) is None:
+        return False
+
     for pattern in SENSITIVE_KEYWORD_PATTERNS:
         if pattern.search(combined):
             return True
 
     has_code = bool(CODE_TOKEN_PATTERN.search(body))
-    has_security_context = bool(
-        re.search(
-            r"\b(verify|verification|security|login|signin|sign in|auth|account|bank|google|intuit)\b",
-            combined,
-            re.IGNORECASE,
-        )
-    )
+    has_security_context = bool(SECURITY_CONTEXT_PATTERN.search(combined))
     return has_code and has_security_context
 
 
@@ -869,7 +1042,9 @@ def classify_sms_reply_policy(text):
 
 def first_value(value):
     """Return first item for list-like values, otherwise passthrough."""
-    if isinstance(value, (list, tuple)):
+    # Exact type checks: JSON decoding only ever produces bare lists, and
+    # the common scalar case skips the isinstance tuple walk entirely.
+    if type(value) is list or type(value) is tuple:
         return value[0] if value else None
     return value
 
@@ -906,27 +1081,51 @@ def detect_reliable_missed_call_hint(data):
     if str(data.get("direction", "")).lower() != "inbound":
         return False
 
-    if not is_blank_text(extract_message_text(data)):
-        return False
+    return _detect_missed_call_hint_inbound(data)
+
+
+_EVENT_TEXT_FIELDS = ("event_type", "event", "type", "subscription_type", "topic")
+
+
+def _event_text_blob(data):
+    """Join the event-describing fields, lowercased once for scanning."""
+    return " ".join(str(data.get(k, "")) for k in _EVENT_TEXT_FIELDS).lower()
 
-    event_fields = ("event_type", "event", "type", "subscription_type", "topic")
-    event_text = " ".join(str(data.get(k, "")).lower() for k in event_fields)
-    call_state = str(data.get("call_state", "")).lower()
 
+def _detect_missed_call_hint_inbound(data, text_known_blank=False):
+    """Missed-call hint check for callers that already verified direction.
+
+    classify_inbound_notification and the webhook handler normalize the
+    direction once up front; routing through this entry point keeps them
+    from re-stringifying and re-lowering it per check. Callers that have
+    already established the text is blank pass text_known_blank to skip
+    the repeat extraction.
+    """
+    if not text_known_blank and not is_blank_text(extract_message_text(data)):
+        return False
+
+    # Explicit flags and call_state settle the signal without building the
+    # joined event blob; only payloads lacking them pay the join + scan.
+    event_text = None
     has_missed_signal = (
         data.get("call_missed") is True
         or data.get("missed_call") is True
         or data.get("is_missed_call") is True
-        or call_state in MISSED_CALL_STATES
-        or any(hint in event_text for hint in MISSED_CALL_EVENT_HINTS)
-        or ("call" in event_text and ("no_answer" in event_text or "unanswered" in event_text))
+        or str(data.get("call_state", "")).lower() in MISSED_CALL_STATES
     )
     if not has_missed_signal:
-        return False
+        event_text = _event_text_blob(data)
+        has_missed_signal = _MISSED_HINT_RE.search(event_text) is not None or (
+            "call" in event_text and _NO_ANSWER_RE.search(event_text) is not None
+        )
+        if not has_missed_signal:
+            return False
 
-    has_call_context = any(key in data for key in CALL_CONTEXT_FIELDS) or "call" in event_text
-    if not has_call_context:
-        return False
+    if not any(key in data for key in CALL_CONTEXT_FIELDS):
+        if event_text is None:
+            event_text = _event_text_blob(data)
+        if "call" not in event_text:
+            return False
 
     from_num = extract_number(data, "from_number", "caller_number", "from")
     return bool(str(from_num or "").strip())
@@ -939,9 +1138,21 @@ def classify_inbound_notification(data):
     """
     if str(data.get("direction", "")).lower() != "inbound":
         return "not_inbound"
-    if detect_reliable_missed_call_hint(data):
-        return "missed_call"
-    if is_blank_text(extract_message_text(data)):
+    return _classify_inbound(data)
+
+
+def _classify_inbound(data, text=None):
+    """Classification for payloads already known to be inbound.
+
+    Non-blank text (the common case) settles as "sms" with a single text
+    extraction; only blank payloads pay the missed-call hint detection.
+    The webhook handler passes in the text it already extracted.
+    """
+    if text is None:
+        text = extract_message_text(data)
+    if is_blank_text(text):
+        if _detect_missed_call_hint_inbound(data, text_known_blank=True):
+            return "missed_call"
         return "blank_sms"
     return "sms"
 
@@ -1013,14 +1224,29 @@ def assess_inbound_sms_alert_eligibility(
     }
 
 
+# MarkdownV1 control characters; one compiled sub replaces the chain of
+# str.replace passes (and their intermediate copies) per dynamic field.
+_MD_ESCAPE_RE = re.compile(r"([_*`\[])")
+
+
 def escape_telegram_markdown(text):
     """Escape Telegram MarkdownV1 control characters in dynamic content."""
     if text is None:
         return ""
-    escaped = str(text)
-    for ch in ("_", "*", "`", "["):
-        escaped = escaped.replace(ch, f"\\{ch}")
-    return escaped
+    return _MD_ESCAPE_RE.sub(r"\\\1", str(text))
+
+
+def format_sender_display(contact_info, from_num):
+    """Markdown sender line for call/voicemail Telegram cards.
+
+    Named contact first (the common branch for known senders), then the
+    literal "Unknown" sentinel, then a bare monospace number.
+    """
+    if contact_info:
+        return f"*{contact_info}* (`{from_num}`)"
+    if from_num == "Unknown":
+        return "Unknown"
+    return f"`{from_num}`"
 
 
 def telegram_buttons_available():
@@ -1093,14 +1319,24 @@ def build_sms_approval_reply_markup(draft_id, reply_policy=None, *, risk_confirm
     }
 
 
+@functools.lru_cache(maxsize=8)
+def _telegram_api_url(token, method):
+    """Bot API endpoint for a method, cached on the (token, method) pair.
+
+    Keyed on the token global rather than computed at import so tests (and
+    anything else) that rebind TELEGRAM_BOT_TOKEN still take effect.
+    """
+    return f"https://api.telegram.org/bot{token}/{method}"
+
+
 def call_telegram_api(method, payload, *, timeout=10):
     """Call Telegram Bot API and return True on success."""
     if not TELEGRAM_BOT_TOKEN:
         print("⚠️  Telegram not configured (missing BOT_TOKEN)")
         return False
 
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/{method}"
-    data = json.dumps(payload).encode("utf-8")
+    url = _telegram_api_url(TELEGRAM_BOT_TOKEN, method)
+    data = _json_dumps_bytes(payload)
     req = urllib.request.Request(
         url,
         data=data,
@@ -1358,24 +1594,57 @@ def parse_signature_candidates(header_value):
     return candidates
 
 
+@functools.lru_cache(maxsize=8)
+def _hmac_template(secret):
+    """Keyed HMAC-SHA256 template for a secret.
+
+    hmac.new re-derives the inner/outer pad key schedule from the secret on
+    every call; copying a cached template skips that per request and leaves
+    only the body digest to compute.
+    """
+    return hmac.new(secret.encode("utf-8"), b"", hashlib.sha256)
+
+
+_SIGNATURE_HEADER_NAMES = frozenset({"x-dialpad-signature", "x-dialpad-signature-sha256"})
+
+
+def _signature_header_values(headers):
+    """Collect both Dialpad signature headers in one pass over the mapping.
+
+    Two _get_header calls would each fall back to a full case-insensitive
+    scan for plain-dict headers; one walk gathers both.
+    """
+    values = []
+    items = headers.items() if hasattr(headers, "items") else ()
+    for key, value in items:
+        if value and str(key).lower() in _SIGNATURE_HEADER_NAMES:
+            values.append(value)
+    return values
+
+
 def verify_hmac_signature(raw_body, headers, secret):
     """Verify Dialpad HMAC SHA256 signature header against raw request body."""
     if not secret:
         return True
 
-    sig_values = [
-        _get_header(headers, "X-Dialpad-Signature"),
-        _get_header(headers, "X-Dialpad-Signature-SHA256"),
-    ]
     provided = []
-    for sig_value in sig_values:
+    for sig_value in _signature_header_values(headers):
         provided.extend(parse_signature_candidates(sig_value))
 
+    # No candidates: bail before paying the body HMAC — unauthenticated
+    # probes never reach the digest.
     if not provided:
         return False
 
-    expected = hmac.new(secret.encode("utf-8"), raw_body, hashlib.sha256).hexdigest()
-    return any(hmac.compare_digest(candidate, expected) for candidate in provided)
+    mac = _hmac_template(secret).copy()
+    mac.update(raw_body)
+    expected = mac.digest()
+    # parse_signature_candidates guarantees 64 lowercase hex chars, so
+    # fromhex cannot raise; comparing 32-byte digests halves the
+    # constant-time walk versus the 64-char hex strings.
+    return any(
+        hmac.compare_digest(bytes.fromhex(candidate), expected) for candidate in provided
+    )
 
 
 def _b64url_decode(segment):
@@ -1389,11 +1658,12 @@ def extract_bearer_token(headers):
     auth = _get_header(headers, "Authorization")
     if not auth:
         return None
-    parts = auth.strip().split(" ", 1)
-    if len(parts) != 2 or parts[0].lower() != "bearer":
+    # partition allocates one tuple and always yields three parts, so no
+    # length check is needed; a missing separator leaves token empty.
+    scheme, _, token = auth.strip().partition(" ")
+    if scheme != "Bearer" and scheme.lower() != "bearer":
         return None
-    token = parts[1].strip()
-    return token or None
+    return token.strip() or None
 
 
 def verify_bearer_jwt(headers, secret):
@@ -5194,9 +5464,28 @@ def format_hook_message(normalized_event, line_display=None, callback_url=None,
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=4)
+def _openclaw_hooks_url(base_url, path):
+    """Join gateway base and hooks path, cached on the config pair.
+
+    Keyed on the module globals rather than computed at import so tests
+    (and anything else) that rebind the config still take effect.
+    """
+    return f"{base_url.rstrip('/')}/{path.lstrip('/')}"
+
+
+@functools.lru_cache(maxsize=4)
+def _openclaw_hooks_headers(token):
+    """Request headers for the hooks gateway, cached per token."""
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {token}",
+    }
+
+
 def get_openclaw_hooks_url():
     """Build complete OpenClaw hooks URL from gateway + path env vars."""
-    return f"{OPENCLAW_GATEWAY_URL.rstrip('/')}/{OPENCLAW_HOOKS_PATH.lstrip('/')}"
+    return _openclaw_hooks_url(OPENCLAW_GATEWAY_URL, OPENCLAW_HOOKS_PATH)
 
 
 def build_openclaw_hook_payload(normalized_event, line_display=None):
@@ -5304,14 +5593,11 @@ def send_to_openclaw_hooks(normalized_event, line_display=None):
     payload = build_openclaw_hook_payload(normalized_event, line_display=line_display)
 
     url = get_openclaw_hooks_url()
-    data = json.dumps(payload).encode("utf-8")
+    data = _json_dumps_bytes(payload)
     req = urllib.request.Request(
         url,
         data=data,
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {OPENCLAW_HOOKS_TOKEN}",
-        },
+        headers=_openclaw_hooks_headers(OPENCLAW_HOOKS_TOKEN),
     )
 
     try:
@@ -5523,16 +5809,48 @@ def _fallback_timer_callback(job_id, start_monotonic, db_path=None):
     )
 
 
+# ACK bodies encoded once at import: every webhook ends in one of these two
+# (stored, duplicate) shapes, so the per-request dict build + dumps is skipped.
+_ACK_BODIES = {
+    (stored, duplicate): _json_dumps_bytes(
+        {"status": "ok", "stored": stored, "processing": "duplicate" if duplicate else "async"}
+    )
+    for stored in (True, False)
+    for duplicate in (True, False)
+}
+
+
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
 class DialpadWebhookHandler(BaseHTTPRequestHandler):
     """HTTP request handler for Dialpad webhooks"""
 
+    # HTTP/1.1 lets Dialpad's retry/poll connections reuse the socket instead
+    # of re-handshaking per request. Requires every response to carry
+    # Content-Length, which all paths below (and send_error) now do.
+    protocol_version = "HTTP/1.1"
+
+    # One dict hit routes any POST; unknown probes 404 without walking an if
+    # chain. Method names (not bound methods) so per-instance test patches
+    # still resolve through getattr at call time.
+    _POST_ROUTES = {
+        "/store": "handle_store",
+        "/webhook/dialpad": "handle_webhook",
+        "/webhook/telegram": "handle_telegram_webhook",
+        "/webhook/dialpad-call": "handle_call_webhook",
+        "/webhook/dialpad-voicemail": "handle_voicemail_webhook",
+        "/internal/draft-callback": "handle_draft_callback",
+    }
+
     def do_GET(self):
         """Handle GET requests (health check only)"""
         if self.path == "/health":
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(_HEALTH_BODY)))
             self.end_headers()
-            self.wfile.write(b'{"status":"ok"}')
+            self.wfile.write(_HEALTH_BODY)
         else:
             self.send_error(404, "Not Found")
 
@@ -5540,44 +5858,20 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
         """Handle POST requests"""
         log_line(f"➡️  HTTP POST {self.path} from={self.client_address[0]}")
 
-        # /store endpoint - called by OpenClaw plugin to store messages
-        if self.path == "/store":
-            self.handle_store()
-            return
-
-        # /webhook/dialpad - main webhook endpoint
-        if self.path == "/webhook/dialpad":
-            self.handle_webhook()
-            return
-
-        # /webhook/telegram - Telegram inline approval callbacks
-        if self.path == "/webhook/telegram":
-            self.handle_telegram_webhook()
-            return
-
-        # /webhook/dialpad-call - missed call notifications
-        if self.path == "/webhook/dialpad-call":
-            self.handle_call_webhook()
-            return
-
-        # /webhook/dialpad-voicemail - voicemail notifications
-        if self.path == "/webhook/dialpad-voicemail":
-            self.handle_voicemail_webhook()
-            return
-
-        # /internal/draft-callback - agent draft callback (merged-flow)
-        if self.path == "/internal/draft-callback":
-            self.handle_draft_callback()
+        handler_name = self._POST_ROUTES.get(self.path)
+        if handler_name is None:
+            self.send_error(404, "Not Found")
             return
-
-        self.send_error(404, "Not Found")
+        getattr(self, handler_name)()
 
     def send_json_response(self, status_code, payload):
-        """Send a JSON response."""
+        """Send a JSON response with an explicit Content-Length."""
+        body = _json_dumps_bytes(payload)
         self.send_response(status_code)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(payload).encode())
+        self.wfile.write(body)
 
     def _ack_webhook_200(self, *, stored=True, duplicate=False):
         """ACK Dialpad with a complete 200 before slow processing (ACK-first).
@@ -5588,9 +5882,11 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
         blocks other requests or delays this ACK — eliminating the retry storms a
         24s inline draft lookup would otherwise cause. Content-Length + flush let
         Dialpad treat the response as complete immediately."""
-        body = json.dumps(
-            {"status": "ok", "stored": stored, "processing": "duplicate" if duplicate else "async"}
-        ).encode()
+        body = _ACK_BODIES.get((stored, duplicate))
+        if body is None:
+            body = _json_dumps_bytes(
+                {"status": "ok", "stored": stored, "processing": "duplicate" if duplicate else "async"}
+            )
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
@@ -5601,24 +5897,56 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
         except Exception:  # noqa: BLE001 - ACK already written; flush is best-effort.
             pass
 
-    def read_json_body(self, endpoint_label):
-        """Read a bounded JSON request body."""
-        max_body_size = 1024 * 1024
+    def _read_raw_body(self):
+        """Read the request body, bounded by MAX_BODY_SIZE.
+
+        Missing, malformed, or negative Content-Length reads zero bytes —
+        read(-1)/read() would block on the socket waiting for EOF. Oversized
+        declarations fail fast with 413 and return None: a truncated body
+        would fail HMAC verification and JSON parsing anyway, after reading
+        (and buffering) a megabyte of it.
+        """
         try:
             requested_length = int(self.headers.get("Content-Length", 0))
         except (TypeError, ValueError):
             requested_length = 0
-        content_length = min(requested_length, max_body_size)
-        raw_body = self.rfile.read(content_length)
+        if requested_length > MAX_BODY_SIZE:
+            self.send_error(413, "Payload too large")
+            return None
+        return self.rfile.read(max(requested_length, 0))
+
+    def read_json_body(self, endpoint_label):
+        """Read a bounded JSON request body; (None, None) once 413 is sent."""
+        raw_body = self._read_raw_body()
+        if raw_body is None:
+            return None, None
         try:
-            return raw_body, json.loads(raw_body.decode("utf-8")) if raw_body else {}
+            # json.loads accepts bytes directly; decoding first would just
+            # materialize a second full copy of the body.
+            return raw_body, _json_loads(raw_body) if raw_body else {}
         except json.JSONDecodeError as exc:
             print(f"❌ Invalid JSON payload on {endpoint_label}: {exc}")
             return raw_body, None
 
+    def _parse_json_or_400(self, raw_body, endpoint_label):
+        """Parse an already-read (and already-authenticated) body.
+
+        The HMAC-verified handlers cannot use read_json_body because auth
+        must see the raw bytes before any parsing; this carries the shared
+        except-log-400 tail for them. Returns None once the 400 is sent.
+        """
+        try:
+            return _json_loads(raw_body) if raw_body else {}
+        except json.JSONDecodeError as exc:
+            print(f"❌ Invalid JSON payload on {endpoint_label}: {exc}")
+            self.send_error(400, "Invalid JSON")
+            return None
+
     def handle_telegram_webhook(self):
         """Handle Telegram inline button callback updates."""
-        _raw_body, data = self.read_json_body("/webhook/telegram")
+        raw_body, data = self.read_json_body("/webhook/telegram")
+        if raw_body is None:
+            return
         if data is None:
             self.send_error(400, "Invalid JSON")
             return
@@ -5683,26 +6011,19 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
 
     def handle_store(self):
         """Handle /store endpoint - stores message in SQLite, called by OpenClaw plugin"""
-        # Limit request body size to prevent memory exhaustion (1MB max)
-        MAX_BODY_SIZE = 1024 * 1024  # 1MB
-        content_length = min(int(self.headers.get("Content-Length", 0)), MAX_BODY_SIZE)
-        body = self.rfile.read(content_length).decode("utf-8")
+        raw_body = self._read_raw_body()
+        if raw_body is None:
+            return
 
-        try:
-            data = json.loads(body) if body else {}
-        except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON on /store: {e}")
-            self.send_error(400, "Invalid JSON")
+        data = self._parse_json_or_400(raw_body, "/store")
+        if data is None:
             return
 
         try:
             result = handle_sms_webhook(data)
             stored = result.get("stored", False)
 
-            self.send_response(200 if stored else 500)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self.send_json_response(200 if stored else 500, result)
 
         except Exception as e:
             print(f"❌ Storage error on /store: {e}")
@@ -5710,10 +6031,9 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
 
     def handle_webhook(self):
         """Handle /webhook/dialpad endpoint - main Dialpad webhook"""
-        # Limit request body size to prevent memory exhaustion (1MB max)
-        MAX_BODY_SIZE = 1024 * 1024  # 1MB
-        content_length = min(int(self.headers.get("Content-Length", 0)), MAX_BODY_SIZE)
-        raw_body = self.rfile.read(content_length)
+        raw_body = self._read_raw_body()
+        if raw_body is None:
+            return
 
         auth_ok, auth_source = verify_webhook_auth(self.headers, raw_body, WEBHOOK_SECRET)
         if not auth_ok:
@@ -5721,25 +6041,22 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
             self.send_error(401, "Unauthorized")
             return
 
-        body = raw_body.decode("utf-8")
         log_line(
             f"📥 /webhook/dialpad hit bytes={len(raw_body)} auth={auth_source} "
             f"ua={_get_header(self.headers, 'User-Agent') or 'unknown'}"
         )
 
-        try:
-            data = json.loads(body) if body else {}
-        except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON payload: {e}")
-            self.send_error(400, "Invalid JSON")
+        data = self._parse_json_or_400(raw_body, "/webhook/dialpad")
+        if data is None:
             return
 
-        timestamp = datetime.now().isoformat()
         direction = str(data.get("direction", "unknown")).lower()
         from_num = first_value(data.get("from_number")) or "N/A"
         to_num = data.get("to_number")
         text = extract_message_text(data)
-        notification_type = classify_inbound_notification(data) if direction == "inbound" else "not_inbound"
+        # direction was normalized above; skip classify's repeat of that check,
+        # and hand over the already-extracted text so it isn't re-derived.
+        notification_type = _classify_inbound(data, text) if direction == "inbound" else "not_inbound"
 
         # ACK-first idempotent intake: claim the inbound BEFORE storage so a
         # Dialpad retry short-circuits before ANY side effect (storage, draft,
@@ -5753,6 +6070,14 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
                 print("   ♻️  Duplicate inbound SMS — skipping reprocessing")
                 return
 
+        # Outbound skip knob: receipts and reply context both read stored
+        # outbound rows, so storage stays on by default; deployments that only
+        # consume inbound alerts can shed the INSERT + FTS write per event.
+        if direction != "inbound" and not DIALPAD_STORE_OUTBOUND:
+            self._ack_webhook_200(stored=False, duplicate=False)
+            print(f"   ⏭️  {direction or 'unknown'} event not stored (DIALPAD_STORE_OUTBOUND=0)")
+            return
+
         # Store message in SQLite
         try:
             result = handle_sms_webhook(data)
@@ -5779,6 +6104,9 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
             # the inbound still gets its side effects exactly once instead of being
             # silently suppressed by the retry's duplicate short-circuit.
             print("⚠️  ACK write failed (client disconnect); processing inbound anyway")
+        # Only the post-ACK console log uses the timestamp; duplicate and
+        # failure paths above exit without rendering one at all.
+        timestamp = _iso_now()
         try:
             self._process_inbound_post_ack(
                 data, result, from_num, to_num, text, direction, notification_type, timestamp, auth_source
@@ -5835,6 +6163,16 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
                     sender_enrichment["payload_contact_used"] = True
                     if sender_enrichment.get("status") in {None, "not_found", "not_applicable", "disabled"}:
                         sender_enrichment["status"] = "payload_contact"
+            if not contact_info:
+                # Local-first: before settling for an unnamed sender, reuse a
+                # name stored from earlier traffic — repeat senders keep their
+                # display name even when the Dialpad lookup found nothing.
+                stored_name = lookup_stored_contact_name(from_num)
+                if stored_name and stored_name != "Unknown":
+                    contact_info = stored_name
+                    sender_enrichment.setdefault("stored_contact_name", stored_name)
+                    if sender_enrichment.get("status") in {None, "not_found", "not_applicable", "disabled"}:
+                        sender_enrichment["status"] = "stored_contact"
             sender_enrichment["contact_name"] = contact_info
 
             inbound_alert_decision = assess_inbound_sms_alert_eligibility(
@@ -6096,44 +6434,45 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
                         normalized_sms, line_display=line_display
                     )
 
-        # Console logging
-        print(f"[{timestamp}]")
-        print(f"   📱 {direction.upper()}: {from_num}")
+        # Console logging: assemble the block and write it once, so concurrent
+        # handler threads take the stdout lock per request instead of per line
+        # and the block lands in the journal contiguously.
+        log_block = [f"[{timestamp}]", f"   📱 {direction.upper()}: {from_num}"]
         if text:
-            text_preview = text[:60] + "..." if len(text) > 60 else text
-            print(f"   📄 \"{text_preview}\"")
-        print(f"   💾 Stored: ✓")
+            text_preview = _preview(text, 60)
+            log_block.append(f"   📄 \"{text_preview}\"")
+        log_block.append("   💾 Stored: ✓")
         if WEBHOOK_SECRET:
-            print(f"   🔐 Auth: ✓ ({auth_source})")
+            log_block.append(f"   🔐 Auth: ✓ ({auth_source})")
         if direction == "inbound":
-            print(
+            log_block.append(
                 "   🧭 Inbound Alert Eligibility: "
                 f"{'allow' if inbound_alert_decision['eligible'] else 'block'} "
                 f"({inbound_alert_decision['reason_code']})"
             )
             if sensitive_filtered:
-                print(f"   🪝 OpenClaw Hook: ✗ ({hook_status} — filtered)")
+                log_block.append(f"   🪝 OpenClaw Hook: ✗ ({hook_status} — filtered)")
             else:
-                print(f"   🪝 OpenClaw Hook: {'✓' if hook_sent else '✗'} ({hook_status})")
+                log_block.append(f"   🪝 OpenClaw Hook: {'✓' if hook_sent else '✗'} ({hook_status})")
             if telegram_sms_sent is not None:
-                print(f"   📨 Telegram SMS Alert: {'✓' if telegram_sms_sent else '✗'} ({telegram_status})")
+                log_block.append(f"   📨 Telegram SMS Alert: {'✓' if telegram_sms_sent else '✗'} ({telegram_status})")
             else:
-                print(f"   📨 Telegram SMS Alert: ✗ ({telegram_status})")
+                log_block.append(f"   📨 Telegram SMS Alert: ✗ ({telegram_status})")
             if auto_reply_status is not None and not auto_reply_sent:
-                print(f"   🤖 Auto Reply: ✗ ({auto_reply_status})")
+                log_block.append(f"   🤖 Auto Reply: ✗ ({auto_reply_status})")
             if sender_enrichment.get("degraded"):
-                print(
+                log_block.append(
                     "   ⚠️  Sender enrichment degraded "
                     f"({sender_enrichment.get('degraded_reason')})"
                 )
-        print()
+        log_block.append("")
+        print("\n".join(log_block), flush=True)
 
     def handle_call_webhook(self):
         """Handle /webhook/dialpad-call endpoint - missed call notifications"""
-        # Limit request body size to prevent memory exhaustion (1MB max)
-        MAX_BODY_SIZE = 1024 * 1024  # 1MB
-        content_length = min(int(self.headers.get("Content-Length", 0)), MAX_BODY_SIZE)
-        raw_body = self.rfile.read(content_length)
+        raw_body = self._read_raw_body()
+        if raw_body is None:
+            return
 
         auth_ok, auth_source = verify_webhook_auth(self.headers, raw_body, WEBHOOK_SECRET)
         if not auth_ok:
@@ -6141,13 +6480,8 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
             self.send_error(401, "Unauthorized")
             return
 
-        body = raw_body.decode("utf-8")
-
-        try:
-            data = json.loads(body) if body else {}
-        except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON payload on /webhook/dialpad-call: {e}")
-            self.send_error(400, "Invalid JSON")
+        data = self._parse_json_or_400(raw_body, "/webhook/dialpad-call")
+        if data is None:
             return
 
         direction = data.get("call_direction", data.get("direction", "unknown"))
@@ -6191,7 +6525,7 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
             duplicate = bool(dedupe_claim.get("duplicate"))
             missed_call_dedupe_status = dedupe_claim.get("status")
             if duplicate:
-                print(f"[{datetime.now().isoformat()}]")
+                print(f"[{_iso_now()}]")
                 print(f"   📞 MISSED CALL duplicate suppressed: {from_num} -> {resolved['line_display'] or get_line_name(to_num) or 'Unknown'}")
                 print(f"   🧷 Dedupe: {missed_call_dedupe_key} ({missed_call_dedupe_status})")
                 call_id = data.get("call_id") or data.get("id")
@@ -6202,15 +6536,9 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
                     print(f"   📞 Entry point call ID: {entry_point_call_id}")
                 print()
 
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json")
-                self.end_headers()
-                response = {
-                    "status": "ok",
-                    "stored": True,
-                    "processing": "duplicate",
-                }
-                self.wfile.write(json.dumps(response).encode())
+                self.send_json_response(
+                    200, {"status": "ok", "stored": True, "processing": "duplicate"}
+                )
                 return
 
             try:
@@ -6229,7 +6557,7 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
                 missed_call_dedupe_key = canonical_dedupe_key
                 missed_call_dedupe_status = canonical_claim.get("status")
                 if duplicate:
-                    print(f"[{datetime.now().isoformat()}]")
+                    print(f"[{_iso_now()}]")
                     print(f"   📞 MISSED CALL duplicate suppressed after backfill: {from_num} -> {resolved['line_display'] or get_line_name(to_num) or 'Unknown'}")
                     print(f"   🧷 Dedupe: {missed_call_dedupe_key} ({missed_call_dedupe_status})")
                     call_id = data.get("call_id") or data.get("id")
@@ -6253,20 +6581,19 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
             contact_info = sender_enrichment.get("contact_name")
             line_display = resolved["line_display"] or get_line_name(to_num)
             to_display = line_display if line_display else "Unknown"
-            if contact_info:
-                from_display = f"*{contact_info}* (`{from_num}`)"
-            elif from_num == "Unknown":
-                from_display = "Unknown"
-            else:
-                from_display = f"`{from_num}`"
-            time_display = datetime.now().strftime("%I:%M %p").lstrip("0")
+            from_display = format_sender_display(contact_info, from_num)
+            # Prefer the event's own timestamp; only fall back to wall-clock
+            # formatting when it is missing or unparseable.
+            time_display = None
             if call_ts is not None:
                 try:
                     time_display = datetime.fromtimestamp(
                         int(call_ts) / 1000
                     ).astimezone().strftime("%I:%M %p").lstrip("0")
                 except (TypeError, ValueError, OSError, OverflowError):
-                    pass
+                    time_display = None
+            if time_display is None:
+                time_display = datetime.now().strftime("%I:%M %p").lstrip("0")
 
             tg_text = (
                 f"📞 *Missed Call*\n"
@@ -6419,7 +6746,7 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
                     line_display=line_display,
                 )
 
-            print(f"[{datetime.now().isoformat()}]")
+            print(f"[{_iso_now()}]")
             print(f"   📞 MISSED CALL: {from_num} -> {to_display}")
             if WEBHOOK_SECRET:
                 print(f"   🔐 Auth: ✓ ({auth_source})")
@@ -6444,16 +6771,13 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
             print()
             return
         else:
-            print(f"[{datetime.now().isoformat()}]")
+            print(f"[{_iso_now()}]")
             print(f"   📞 CALL EVENT ignored (not inbound missed call)")
             if WEBHOOK_SECRET:
                 print(f"   🔐 Auth: ✓ ({auth_source})")
             print()
 
         # Always return 200 OK (graceful degradation)
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
         response = {
             "status": "ok",
             "missed_call": should_notify,
@@ -6467,7 +6791,7 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
             "auto_reply_draft_id": auto_reply_draft_id if should_notify else None,
             "telegram_sent": telegram_sent if should_notify else None
         }
-        self.wfile.write(json.dumps(response).encode())
+        self.send_json_response(200, response)
 
     def handle_draft_callback(self):
         """Handle /internal/draft-callback — agent draft callback (merged-flow).
@@ -6475,6 +6799,8 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
         The AI agent POSTs its draft answer here instead of posting to Telegram
         directly. The webhook renders the rich card with the agent's draft."""
         raw_body, body_dict = self.read_json_body("draft-callback")
+        if raw_body is None:
+            return
         if body_dict is None:
             self.send_json_response(400, {"error": "invalid JSON body"})
             return
@@ -6528,10 +6854,9 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
 
     def handle_voicemail_webhook(self):
         """Handle /webhook/dialpad-voicemail endpoint - voicemail notifications"""
-        # Limit request body size to prevent memory exhaustion (1MB max)
-        MAX_BODY_SIZE = 1024 * 1024  # 1MB
-        content_length = min(int(self.headers.get("Content-Length", 0)), MAX_BODY_SIZE)
-        raw_body = self.rfile.read(content_length)
+        raw_body = self._read_raw_body()
+        if raw_body is None:
+            return
 
         auth_ok, auth_source = verify_webhook_auth(self.headers, raw_body, WEBHOOK_SECRET)
         if not auth_ok:
@@ -6539,13 +6864,8 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
             self.send_error(401, "Unauthorized")
             return
 
-        body = raw_body.decode("utf-8")
-
-        try:
-            data = json.loads(body) if body else {}
-        except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON payload on /webhook/dialpad-voicemail: {e}")
-            self.send_error(400, "Invalid JSON")
+        data = self._parse_json_or_400(raw_body, "/webhook/dialpad-voicemail")
+        if data is None:
             return
 
         from_num = extract_number(data, "from_number", "caller_number", "from") or "Unknown"
@@ -6568,16 +6888,15 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
         contact_info = sender_enrichment.get("contact_name")
         line_display = get_line_name(to_num)
         to_display = line_display if line_display else "Unknown"
-        if contact_info:
-            from_display = f"*{contact_info}* (`{from_num}`)"
-        elif from_num == "Unknown":
-            from_display = "Unknown"
+        from_display = format_sender_display(contact_info, from_num)
+        if isinstance(duration, int) and not isinstance(duration, bool):
+            # Dialpad sends duration as an integer; skip the float round-trip.
+            duration_seconds = duration
         else:
-            from_display = f"`{from_num}`"
-        try:
-            duration_seconds = int(float(duration))
-        except (TypeError, ValueError):
-            duration_seconds = 0
+            try:
+                duration_seconds = int(float(duration))
+            except (TypeError, ValueError):
+                duration_seconds = 0
         duration_display = f"{duration_seconds}s"
 
         tg_text = (
@@ -6649,13 +6968,13 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
             message_thread_id=route_thread_id,
         )
 
-        print(f"[{datetime.now().isoformat()}]")
+        print(f"[{_iso_now()}]")
         print(f"   📬 VOICEMAIL: {from_num} -> {to_display}")
         if WEBHOOK_SECRET:
             print(f"   🔐 Auth: ✓ ({auth_source})")
         print(f"   ⏱️  Duration: {duration_display}")
         if transcription:
-            trans_preview = transcription[:80] + "..." if len(transcription) > 80 else transcription
+            trans_preview = _preview(transcription, 80)
             print(f"   📝 Transcription: \"{trans_preview}\"")
         if auto_reply_status is not None:
             print(f"   🤖 Auto Reply: {'✓' if auto_reply_sent else '✗'} ({auto_reply_status})")
@@ -6663,18 +6982,14 @@ class DialpadWebhookHandler(BaseHTTPRequestHandler):
         print()
 
         # Always return 200 OK (graceful degradation)
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        response = {
+        self.send_json_response(200, {
             "status": "ok",
             "voicemail": True,
             "telegram_sent": telegram_sent,
             "auto_reply_sent": auto_reply_sent,
             "auto_reply_status": auto_reply_status,
             "auto_reply_draft_id": auto_reply_draft_id,
-        }
-        self.wfile.write(json.dumps(response).encode())
+        })
 
     def log_message(self, format, *args):
         """Suppress default HTTP logging (we do our own)"""
@@ -6698,55 +7013,62 @@ def main():
     # delays other inbound webhooks.
     server = ThreadingHTTPServer(("0.0.0.0", PORT), DialpadWebhookHandler)
 
-    log_line("=" * 60)
-    print("🚀 Dialpad SMS Webhook Server (OpenClaw Hooks)")
-    print("=" * 60)
-    print(f"Port: {PORT}")
-    print(f"Endpoints:")
-    print(f"  - POST /webhook/dialpad (main webhook)")
-    print(f"  - POST /webhook/telegram (Telegram approval callbacks)")
-    print(f"  - POST /webhook/dialpad-call (missed call webhook)")
-    print(f"  - POST /webhook/dialpad-voicemail (voicemail webhook)")
-    print(f"  - GET  /health (health check)")
-    print(f"")
-    print(f"Configuration:")
-    print(f"  - Dialpad API: {'✓' if DIALPAD_API_KEY else '✗ (contact lookup disabled)'}")
-    print(f"  - OpenClaw Gateway URL: {OPENCLAW_GATEWAY_URL}")
-    print(f"  - OpenClaw Hooks Path: {OPENCLAW_HOOKS_PATH}")
-    print(f"  - OpenClaw Hooks Token: {'✓' if OPENCLAW_HOOKS_TOKEN else '✗ (hook forwarding disabled)'}")
-    print(f"  - Telegram Approval Buttons: {'✓' if telegram_buttons_available() else '✗ (disabled or incomplete config)'}")
-    print(f"  - OpenClaw Hooks Name: {OPENCLAW_HOOKS_NAME}")
-    print(f"  - OpenClaw Call Hooks Name: {OPENCLAW_HOOKS_CALL_NAME}")
-    print(f"  - OpenClaw Hooks Channel: {OPENCLAW_HOOKS_CHANNEL or '(unset)'}")
-    print(f"  - OpenClaw Hooks To: {OPENCLAW_HOOKS_TO or '(unset)'}")
-    print(f"  - OpenClaw SMS Hooks Enabled: {'✓' if OPENCLAW_HOOKS_SMS_ENABLED else '✗'}")
-    print(f"  - OpenClaw Call Hooks Enabled: {'✓' if OPENCLAW_HOOKS_CALL_ENABLED else '✗'}")
-    print(f"  - Priority Route To: {DIALPAD_PRIORITY_ROUTE_TO or '(unset)'}")
+    # Assemble the startup banner and emit it with one write: line-buffered
+    # stdout flushes per newline, so ~40 separate prints mean ~40 syscalls
+    # before the server accepts its first request.
+    tg_ready = bool(TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID)
+    banner = [
+        "=" * 60,
+        "🚀 Dialpad SMS Webhook Server (OpenClaw Hooks)",
+        "=" * 60,
+        f"Port: {PORT}",
+        "Endpoints:",
+        "  - POST /webhook/dialpad (main webhook)",
+        "  - POST /webhook/telegram (Telegram approval callbacks)",
+        "  - POST /webhook/dialpad-call (missed call webhook)",
+        "  - POST /webhook/dialpad-voicemail (voicemail webhook)",
+        "  - GET  /health (health check)",
+        "",
+        "Configuration:",
+        f"  - Dialpad API: {'✓' if DIALPAD_API_KEY else '✗ (contact lookup disabled)'}",
+        f"  - OpenClaw Gateway URL: {OPENCLAW_GATEWAY_URL}",
+        f"  - OpenClaw Hooks Path: {OPENCLAW_HOOKS_PATH}",
+        f"  - OpenClaw Hooks Token: {'✓' if OPENCLAW_HOOKS_TOKEN else '✗ (hook forwarding disabled)'}",
+        f"  - Telegram Approval Buttons: {'✓' if telegram_buttons_available() else '✗ (disabled or incomplete config)'}",
+        f"  - OpenClaw Hooks Name: {OPENCLAW_HOOKS_NAME}",
+        f"  - OpenClaw Call Hooks Name: {OPENCLAW_HOOKS_CALL_NAME}",
+        f"  - OpenClaw Hooks Channel: {OPENCLAW_HOOKS_CHANNEL or '(unset)'}",
+        f"  - OpenClaw Hooks To: {OPENCLAW_HOOKS_TO or '(unset)'}",
+        f"  - OpenClaw SMS Hooks Enabled: {'✓' if OPENCLAW_HOOKS_SMS_ENABLED else '✗'}",
+        f"  - OpenClaw Call Hooks Enabled: {'✓' if OPENCLAW_HOOKS_CALL_ENABLED else '✗'}",
+        f"  - Priority Route To: {DIALPAD_PRIORITY_ROUTE_TO or '(unset)'}",
+    ]
     if PRIORITY_ROUTE_PHONES:
-        print(f"  - Priority Route Phones: {', '.join(sorted(PRIORITY_ROUTE_PHONES))}")
+        banner.append(f"  - Priority Route Phones: {', '.join(sorted(PRIORITY_ROUTE_PHONES))}")
     else:
-        print(f"  - Priority Route Phones: (unset)")
+        banner.append("  - Priority Route Phones: (unset)")
     if LINE_TOPIC_ROUTES:
-        print(f"  - Line Topic Routes:")
+        banner.append("  - Line Topic Routes:")
         for line in sorted(LINE_TOPIC_ROUTES.keys()):
             formatted = format_phone_number(line) or line
-            print(f"    - {formatted} -> {LINE_TOPIC_ROUTES[line]}")
+            banner.append(f"    - {formatted} -> {LINE_TOPIC_ROUTES[line]}")
     else:
-        print(f"  - Line Topic Routes: (unset)")
-    print(f"  - OpenClaw Hooks Agent ID: {OPENCLAW_HOOKS_AGENT_ID or '(default)'}")
-    print(f"  - Telegram: {'✓' if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID else '✗ (call/voicemail notifications disabled)'}")
-    print(f"  - SMS Telegram Alerts: {'✓' if DIALPAD_SMS_TELEGRAM_NOTIFY else '✗ (disabled)'}")
-    tg_ready = bool(TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID)
-    print(f"  - Call Notifications: {'✓' if tg_ready else '✗ (Telegram not fully configured)'}")
-    print(f"  - Voicemail Notifications: {'✓' if tg_ready else '✗ (Telegram not fully configured)'}")
-    print(f"  - Webhook Verification: {'✓' if WEBHOOK_SECRET else '✗ (disabled)'}")
-    print(f"  - Line Names:")
+        banner.append("  - Line Topic Routes: (unset)")
+    banner.extend([
+        f"  - OpenClaw Hooks Agent ID: {OPENCLAW_HOOKS_AGENT_ID or '(default)'}",
+        f"  - Telegram: {'✓' if tg_ready else '✗ (call/voicemail notifications disabled)'}",
+        f"  - SMS Telegram Alerts: {'✓' if DIALPAD_SMS_TELEGRAM_NOTIFY else '✗ (disabled)'}",
+        f"  - Call Notifications: {'✓' if tg_ready else '✗ (Telegram not fully configured)'}",
+        f"  - Voicemail Notifications: {'✓' if tg_ready else '✗ (Telegram not fully configured)'}",
+        f"  - Webhook Verification: {'✓' if WEBHOOK_SECRET else '✗ (disabled)'}",
+        "  - Line Names:",
+    ])
     for number in sorted(LINE_NAMES.keys()):
         formatted = format_phone_number(number) or number
-        print(f"    - {LINE_NAMES[number]}: {formatted}")
-    print("=" * 60)
-    print("Press Ctrl+C to stop")
-    print()
+        banner.append(f"    - {LINE_NAMES[number]}: {formatted}")
+    banner.extend(["=" * 60, "Press Ctrl+C to stop", ""])
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
     resumed = resume_pending_drafts_after_restart()
     if resumed["rendered"] or resumed["scheduled"]:
         print(
@@ -65,6 +65,35 @@ def handle_sms_webhook(data: dict) -> dict:
         conn.close()
 
 
+def lookup_contact_name(phone_number):
+    """
+    Return the most recently stored contact name for a phone number.
+    Local-first helper: lets the webhook reuse a name it has already seen
+    (contacts.phone_number is the primary key, so this is an O(1) lookup)
+    instead of re-querying the Dialpad contacts API.
+    """
+    if not phone_number:
+        return None
+    try:
+        conn = init_db()
+    except Exception:
+        return None
+    try:
+        row = conn.execute(
+            "SELECT name FROM contacts WHERE phone_number = ?",
+            (phone_number,),
+        ).fetchone()
+    except Exception:
+        return None
+    finally:
+        conn.close()
+
+    name = row["name"] if row else None
+    if isinstance(name, str):
+        name = name.strip()
+    return name or None
+
+
 def format_notification(response: dict) -> str:
     """Format a stored message for notification"""
     if response.get("status") != "success":
@@ -0,0 +1,20 @@
+"""Shared JSON helpers for the tests: orjson when available, stdlib fallback.
+
+orjson accepts both str and bytes input, so `loads` is a drop-in for
+json.loads at every call site in the suite.
+"""
+
+import json
+
+try:
+    import orjson
+
+    def loads(raw):
+        return orjson.loads(raw)
+
+    def dumps(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    loads = json.loads
+    dumps = json.dumps
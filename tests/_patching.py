@@ -0,0 +1,96 @@
+"""Direct attribute-swap helpers shared across test files.
+
+unittest.mock.patch constructs a MagicMock (full magic-method table) and runs
+Python-level __enter__/__exit__ bookkeeping for every patch in every test.
+Most tests only need "replace this function, put it back afterwards" — a
+plain getattr/setattr swap does that in a few bytecodes. Recorder covers the
+remaining call-count assertions without MagicMock construction.
+"""
+
+import os
+import re
+from contextlib import contextmanager
+
+_MISSING = object()
+
+
+@contextmanager
+def monkey(*swaps):
+    """Temporarily rebind (module, attr, value) triples, restoring on exit."""
+    saved = [(module, attr, getattr(module, attr)) for module, attr, _ in swaps]
+    for module, attr, value in swaps:
+        setattr(module, attr, value)
+    try:
+        yield
+    finally:
+        for module, attr, original in saved:
+            setattr(module, attr, original)
+
+
+@contextmanager
+def envpatch(**overrides):
+    """Set environment variables for the duration of a block.
+
+    A value of None unsets the variable. Lighter than patch.dict, which
+    snapshots and re-walks the whole mapping on enter and exit; this saves
+    and restores only the keys being touched.
+    """
+    saved = {key: os.environ.get(key, _MISSING) for key in overrides}
+    for key, value in overrides.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+    try:
+        yield
+    finally:
+        for key, original in saved.items():
+            if original is _MISSING:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = original
+
+
+def noop(*_args, **_kwargs):
+    """Stand-in for patched-out helpers whose return value is unused."""
+    return None
+
+
+def assert_all_in(needles, haystack):
+    """Assert every needle substring appears in haystack in one scan.
+
+    Compiles the needles into a single alternation so the haystack is walked
+    once instead of once per assertIn. Needles the scan missed (e.g. one
+    needle contained in another) fall back to a plain membership check before
+    being reported as failures.
+    """
+    pattern = re.compile("|".join(re.escape(n) for n in sorted(needles, key=len, reverse=True)))
+    found = set(pattern.findall(haystack))
+    missing = [n for n in needles if n not in found and n not in haystack]
+    if missing:
+        raise AssertionError(f"Expected substrings not found: {missing!r}\nin: {haystack!r}")
+
+
+class Recorder:
+    """Callable test double that records calls and replays a canned result.
+
+    side_effect may be a callable (invoked with the call's arguments) or an
+    exception instance (raised); otherwise ``result`` is returned.
+    """
+
+    def __init__(self, result=None, side_effect=None):
+        self.calls = []
+        self.result = result
+        self.side_effect = side_effect
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            if isinstance(self.side_effect, BaseException):
+                raise self.side_effect
+            return self.side_effect(*args, **kwargs)
+        return self.result
+
+    @property
+    def call_count(self):
+        return len(self.calls)
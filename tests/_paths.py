@@ -0,0 +1,11 @@
+"""Resolved repo paths shared across test files.
+
+Path(__file__).resolve() costs a realpath walk; importing these constants
+runs it once per session instead of once per test module.
+"""
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BIN = ROOT / "bin"
+SCRIPTS = ROOT / "scripts"
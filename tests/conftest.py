@@ -0,0 +1,46 @@
+"""Shared pytest setup for the suite.
+
+Hoists the sys.path entries every test file needs so the whole session pays
+for them once. Only the repo root and bin/ are added here: scripts/ holds
+modules that collide with bin/ wrappers by name (send_sms, lookup_contact,
+export_sms, list_calls), and files that need scripts/ manage its position —
+and the resulting sys.modules state — deliberately (see the preamble in
+test_deal_segment.py). Per-file inserts remain so each test file still runs
+standalone via `python tests/test_x.py`.
+"""
+
+import sys
+
+import pytest
+
+from _paths import ROOT
+
+for _entry in (str(ROOT), str(ROOT / "bin")):
+    if _entry not in sys.path:
+        sys.path.insert(0, _entry)
+
+# Pre-import the shared helper modules whose names exist only under bin/, so
+# the session pays their import cost once during collection. Dual-named
+# wrappers (send_sms, lookup_contact, export_sms, ...) must NOT be cached
+# here: files that import webhook_server rely on resolving the scripts/
+# copies of those names and evict them from sys.modules afterwards (see the
+# preamble in test_attio_note_writeback.py) — a session-wide bin/ pin would
+# break that protocol.
+import _dialpad_compat  # noqa: E402,F401
+import create_contact  # noqa: E402,F401
+import send_group_intro  # noqa: E402,F401
+import update_contact  # noqa: E402,F401
+
+
+@pytest.fixture(autouse=True)
+def _reset_contact_enrichment_cache():
+    """Isolate webhook_server's TTL contact cache between tests.
+
+    Production wants repeat senders served from cache; tests re-resolve the
+    same numbers under different mocked responses, so each test starts with
+    the cache empty. Guarded lookup: webhook_server is only imported by the
+    files that need it (see the eviction protocol note above)."""
+    ws = sys.modules.get("webhook_server")
+    if ws is not None and hasattr(ws, "_CONTACT_CACHE"):
+        ws._CONTACT_CACHE.clear()
+    yield
@@ -1,24 +1,71 @@
-from pathlib import Path
 import io
 import json
+import re
 import sys
 import unittest
-from contextlib import redirect_stderr, redirect_stdout
+from typing import Final
 from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bin"))
+import _fastjson
+
+from _paths import BIN
+
+sys.path.insert(0, str(BIN))
 
 import create_contact
 from _dialpad_compat import WrapperError
 
 
+_ARGV_BASE = ("bin/create_contact.py",)
+
+# Interned command-key tuples for the fake run_generated callbacks: comparing
+# (cmd[0], cmd[1]) against these is a pointer-equality fast path, versus
+# building a slice list and comparing element-wise on every call.
+_LIST = ("contacts", "contacts.list")
+_CREATE = ("contacts", "contacts.create")
+_UPDATE = ("contacts", "contacts.update")
+
+
+def _data_has_owner(raw_payload, owner_pattern):
+    """Probe --data for an owner_id without decoding the whole JSON payload."""
+    return raw_payload is not None and owner_pattern.search(raw_payload) is not None
+
+
+# Repeated assertion substrings, defined once so every comparison reuses a
+# single interned object.
+_ERR_BAD_PAGES: Final = "Invalid --max-pages value. Use a positive integer."
+_ERR_AMBIGUOUS: Final = "Ambiguous contact match"
+
+_OWNER_9 = re.compile(r'"owner_id"\s*:\s*"owner-9"')
+_OWNER_MISSING = re.compile(r'"owner_id"\s*:\s*"missing-owner"')
+
+
 class CreateContactTests(unittest.TestCase):
+    def setUp(self):
+        # Every CLI-invoking test stubs these two invariants identically;
+        # start them once per test here instead of re-entering three context
+        # managers per with-block. Tests that need a failing
+        # require_generated_cli re-patch it locally, which takes precedence.
+        for target in (
+            "create_contact.require_generated_cli",
+            "create_contact.require_api_key",
+        ):
+            patcher = patch(target)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
     def _run_main(self, args):
-        with patch.object(sys, "argv", ["bin/create_contact.py", *args]):
-            stdout = io.StringIO()
-            stderr = io.StringIO()
-            with redirect_stdout(stdout), redirect_stderr(stderr):
-                code = create_contact.main()
+        # Direct stream swap instead of two redirect_* context managers;
+        # this helper runs for every test in the file.
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        old_argv, old_stdout, old_stderr = sys.argv, sys.stdout, sys.stderr
+        sys.argv = [*_ARGV_BASE, *args]
+        sys.stdout, sys.stderr = stdout, stderr
+        try:
+            code = create_contact.main()
+        finally:
+            sys.argv, sys.stdout, sys.stderr = old_argv, old_stdout, old_stderr
         return code, stdout.getvalue(), stderr.getvalue()
 
     def _get_option(self, cmd: list[str], flag: str):
@@ -30,22 +77,21 @@ class CreateContactTests(unittest.TestCase):
         value = self._get_option(cmd, flag)
         if value is None:
             return None
-        return json.loads(value)
+        return _fastjson.loads(value)
 
     def test_create_contact_success_shared_create(self):
         calls: list[list[str]] = []
 
         def fake_run_generated(cmd: list[str]):
             calls.append(cmd)
-            if cmd[:2] == ["contacts", "contacts.list"]:
+            key = (cmd[0], cmd[1])
+            if key == _LIST:
                 return {"items": []}
-            if cmd[:2] == ["contacts", "contacts.create"]:
+            if key == _CREATE:
                 return {"id": "contact-123"}
             raise AssertionError(f"Unexpected command: {cmd}")
 
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=fake_run_generated):
+        with patch("create_contact.run_generated_json", side_effect=fake_run_generated):
             code, out, err = self._run_main([
                 "--first-name", "Alice",
                 "--last-name", "Miller",
@@ -95,9 +141,7 @@ class CreateContactTests(unittest.TestCase):
         self.assertEqual(payload_arg["urls"], ["https://stockton.training/"])
 
     def test_create_contact_api_error_propagates(self):
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=WrapperError("permission denied")):
+        with patch("create_contact.run_generated_json", side_effect=WrapperError("permission denied")):
             code, out, err = self._run_main([
                 "--first-name", "Bob",
                 "--last-name", "Jones",
@@ -112,7 +156,8 @@ class CreateContactTests(unittest.TestCase):
 
         def fake_run_generated(cmd: list[str]):
             calls.append(cmd)
-            if cmd[:2] == ["contacts", "contacts.list"]:
+            key = (cmd[0], cmd[1])
+            if key == _LIST:
                 return {
                     "items": [
                         {
@@ -123,13 +168,11 @@ class CreateContactTests(unittest.TestCase):
                         }
                     ]
                 }
-            if cmd[:2] == ["contacts", "contacts.update"]:
+            if key == _UPDATE:
                 return {"id": "contact-555"}
             raise AssertionError(f"Unexpected command: {cmd}")
 
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=fake_run_generated):
+        with patch("create_contact.run_generated_json", side_effect=fake_run_generated):
             code, out, err = self._run_main([
                 "--first-name", "New",
                 "--last-name", "Contact",
@@ -158,7 +201,8 @@ class CreateContactTests(unittest.TestCase):
 
         def fake_run_generated(cmd: list[str]):
             calls.append(cmd)
-            if cmd[:2] == ["contacts", "contacts.list"]:
+            key = (cmd[0], cmd[1])
+            if key == _LIST:
                 return {
                     "items": [
                         {
@@ -173,13 +217,11 @@ class CreateContactTests(unittest.TestCase):
                         }
                     ]
                 }
-            if cmd[:2] == ["contacts", "contacts.update"]:
+            if key == _UPDATE:
                 return {"id": "contact-77"}
             raise AssertionError(f"Unexpected command: {cmd}")
 
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=fake_run_generated):
+        with patch("create_contact.run_generated_json", side_effect=fake_run_generated):
             code, out, err = self._run_main([
                 "--first-name", "Dana",
                 "--last-name", "Example",
@@ -243,15 +285,14 @@ class CreateContactTests(unittest.TestCase):
 
         def fake_run_generated(cmd: list[str]):
             calls.append(cmd)
-            if cmd[:2] == ["contacts", "contacts.list"]:
+            key = (cmd[0], cmd[1])
+            if key == _LIST:
                 return {"items": [{"id": "local-5", "phones": ["+14155550100"]}]}
-            if cmd[:2] == ["contacts", "contacts.update"]:
+            if key == _UPDATE:
                 return {"id": "local-5"}
             raise AssertionError(f"Unexpected command: {cmd}")
 
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=fake_run_generated):
+        with patch("create_contact.run_generated_json", side_effect=fake_run_generated):
             code, _out, err = self._run_main([
                 "--first-name", "A",
                 "--last-name", "B",
@@ -284,18 +325,16 @@ class CreateContactTests(unittest.TestCase):
 
         def fake_run_generated(cmd: list[str]):
             calls.append(cmd)
-            if cmd[:2] == ["contacts", "contacts.list"]:
+            key = (cmd[0], cmd[1])
+            if key == _LIST:
                 return {"items": []}
-            if cmd[:2] == ["contacts", "contacts.create"]:
-                payload = self._get_json_option(cmd, "--data")
-                if payload.get("owner_id") == "owner-9":
+            if key == _CREATE:
+                if _data_has_owner(self._get_option(cmd, "--data"), _OWNER_9):
                     return {"id": "local-1"}
                 return {"id": "shared-1"}
             raise AssertionError(f"Unexpected command: {cmd}")
 
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=fake_run_generated):
+        with patch("create_contact.run_generated_json", side_effect=fake_run_generated):
             code, out, err = self._run_main([
                 "--first-name", "Sam",
                 "--last-name", "Auto",
@@ -318,7 +357,8 @@ class CreateContactTests(unittest.TestCase):
 
         def fake_run_generated(cmd: list[str]):
             calls.append(cmd)
-            if cmd[:2] == ["contacts", "contacts.list"]:
+            key = (cmd[0], cmd[1])
+            if key == _LIST:
                 return {
                     "items": [
                         {
@@ -329,13 +369,11 @@ class CreateContactTests(unittest.TestCase):
                         }
                     ]
                 }
-            if cmd[:2] == ["contacts", "contacts.update"]:
+            if key == _UPDATE:
                 return {"id": "contact-777"}
             raise AssertionError(f"Unexpected command: {cmd}")
 
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=fake_run_generated):
+        with patch("create_contact.run_generated_json", side_effect=fake_run_generated):
             code, out, err = self._run_main([
                 "--first-name", "Local",
                 "--last-name", "User",
@@ -356,18 +394,16 @@ class CreateContactTests(unittest.TestCase):
 
         def fake_run_generated(cmd: list[str]):
             calls.append(cmd)
-            if cmd[:2] == ["contacts", "contacts.list"]:
+            key = (cmd[0], cmd[1])
+            if key == _LIST:
                 return {"items": []}
-            if cmd[:2] == ["contacts", "contacts.create"]:
-                payload = self._get_json_option(cmd, "--data")
-                if payload.get("owner_id") == "missing-owner":
+            if key == _CREATE:
+                if _data_has_owner(self._get_option(cmd, "--data"), _OWNER_MISSING):
                     raise WrapperError("Request failed: 404 owner not found")
                 return {"id": "shared-1"}
             raise AssertionError(f"Unexpected command: {cmd}")
 
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=fake_run_generated):
+        with patch("create_contact.run_generated_json", side_effect=fake_run_generated):
             code, out, err = self._run_main([
                 "--first-name", "Warn",
                 "--last-name", "Owner",
@@ -388,7 +424,8 @@ class CreateContactTests(unittest.TestCase):
 
     def test_create_contact_rejects_ambiguous_shared_match(self):
         def fake_run_generated(cmd: list[str]):
-            if cmd[:2] == ["contacts", "contacts.list"]:
+            key = (cmd[0], cmd[1])
+            if key == _LIST:
                 return {
                     "items": [
                         {"id": "a1", "display_name": "Alice One", "phones": ["+14155550123"]},
@@ -397,9 +434,7 @@ class CreateContactTests(unittest.TestCase):
                 }
             raise AssertionError(f"Unexpected command: {cmd}")
 
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=fake_run_generated):
+        with patch("create_contact.run_generated_json", side_effect=fake_run_generated):
             code, out, err = self._run_main([
                 "--first-name", "Alice",
                 "--last-name", "User",
@@ -408,11 +443,12 @@ class CreateContactTests(unittest.TestCase):
 
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
-        self.assertIn("Ambiguous contact match", err)
+        self.assertIn(_ERR_AMBIGUOUS, err)
 
     def test_create_contact_rejects_ambiguous_local_match(self):
         def fake_run_generated(cmd: list[str]):
-            if cmd[:2] == ["contacts", "contacts.list"]:
+            key = (cmd[0], cmd[1])
+            if key == _LIST:
                 return {
                     "items": [
                         {"id": "l1", "display_name": "Local One", "phones": ["+14155550123"]},
@@ -421,9 +457,7 @@ class CreateContactTests(unittest.TestCase):
                 }
             raise AssertionError(f"Unexpected command: {cmd}")
 
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=fake_run_generated):
+        with patch("create_contact.run_generated_json", side_effect=fake_run_generated):
             code, out, err = self._run_main([
                 "--first-name", "Local",
                 "--last-name", "User",
@@ -434,12 +468,10 @@ class CreateContactTests(unittest.TestCase):
 
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
-        self.assertIn("Ambiguous contact match", err)
+        self.assertIn(_ERR_AMBIGUOUS, err)
 
     def test_create_contact_rejects_zero_max_pages(self):
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json"):
+        with patch("create_contact.run_generated_json"):
             code, out, err = self._run_main([
                 "--first-name", "Invalid",
                 "--last-name", "Pages",
@@ -449,12 +481,10 @@ class CreateContactTests(unittest.TestCase):
 
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
-        self.assertIn("Invalid --max-pages value. Use a positive integer.", err)
+        self.assertIn(_ERR_BAD_PAGES, err)
 
     def test_create_contact_rejects_negative_max_pages(self):
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json"):
+        with patch("create_contact.run_generated_json"):
             code, out, err = self._run_main([
                 "--first-name", "Invalid",
                 "--last-name", "Pages",
@@ -464,7 +494,7 @@ class CreateContactTests(unittest.TestCase):
 
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
-        self.assertIn("Invalid --max-pages value. Use a positive integer.", err)
+        self.assertIn(_ERR_BAD_PAGES, err)
 
     def test_create_contact_fails_when_generated_cli_unavailable(self):
         with patch(
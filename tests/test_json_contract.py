@@ -6,12 +6,16 @@ import json
 import sqlite3
 import sys
 import unittest
-from contextlib import redirect_stderr, redirect_stdout
 from datetime import date
 from pathlib import Path
+from contextlib import ExitStack
 from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bin"))
+import _fastjson
+
+from _paths import BIN
+
+sys.path.insert(0, str(BIN))
 
 import create_contact
 import create_sms_webhook
@@ -26,7 +30,7 @@ from _dialpad_compat import ERROR_CODES, WrapperError
 
 LIST_CALLS_SPEC = importlib.util.spec_from_file_location(
     "bin_list_calls_contract",
-    Path(__file__).resolve().parent.parent / "bin" / "list_calls.py",
+    BIN / "list_calls.py",
 )
 assert LIST_CALLS_SPEC is not None and LIST_CALLS_SPEC.loader is not None
 list_calls_wrapper = importlib.util.module_from_spec(LIST_CALLS_SPEC)
@@ -34,24 +38,64 @@ LIST_CALLS_SPEC.loader.exec_module(list_calls_wrapper)
 
 GET_CALL_TRANSCRIPT_SPEC = importlib.util.spec_from_file_location(
     "bin_get_call_transcript_contract",
-    Path(__file__).resolve().parent.parent / "bin" / "get_call_transcript.py",
+    BIN / "get_call_transcript.py",
 )
 assert GET_CALL_TRANSCRIPT_SPEC is not None and GET_CALL_TRANSCRIPT_SPEC.loader is not None
 get_call_transcript_wrapper = importlib.util.module_from_spec(GET_CALL_TRANSCRIPT_SPEC)
 GET_CALL_TRANSCRIPT_SPEC.loader.exec_module(get_call_transcript_wrapper)
 
 
+class _CaptureIO(io.StringIO):
+    """StringIO stand-in for sys.stdout/stderr that also exposes .buffer.
+
+    The wrappers emit text today; if one ever writes bytes through
+    sys.stdout.buffer.write (e.g. orjson envelopes), the capture accepts
+    them directly instead of raising AttributeError or forcing a codec
+    round-trip through a text stream.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.buffer = io.BytesIO()
+
+    def text(self):
+        raw = self.buffer.getvalue()
+        if raw:
+            return self.getvalue() + raw.decode("utf-8")
+        return self.getvalue()
+
+
+def _patched(*patchers):
+    """Enter several mock patches through one ExitStack.
+
+    Linearizes setup/teardown into a single context frame instead of the
+    nested __enter__/__exit__ chain a backslash-continued with-stack compiles
+    to. Use only when no mock handle is needed; stacks that bind mocks with
+    `as` stay inline.
+    """
+    stack = ExitStack()
+    for patcher in patchers:
+        stack.enter_context(patcher)
+    return stack
+
+
 class JsonContractTests(unittest.TestCase):
     def _run(self, module, argv: list[str]) -> tuple[int, str, str]:
-        with patch.object(sys, "argv", argv):
-            stdout = io.StringIO()
-            stderr = io.StringIO()
-            with redirect_stdout(stdout), redirect_stderr(stderr):
-                code = module.main()
-        return code, stdout.getvalue(), stderr.getvalue()
+        # Direct stream swap instead of patch.object + two redirect_* context
+        # managers; this helper runs for every test in the class.
+        stdout = _CaptureIO()
+        stderr = _CaptureIO()
+        old_argv, old_stdout, old_stderr = sys.argv, sys.stdout, sys.stderr
+        sys.argv = argv
+        sys.stdout, sys.stderr = stdout, stderr
+        try:
+            code = module.main()
+        finally:
+            sys.argv, sys.stdout, sys.stderr = old_argv, old_stdout, old_stderr
+        return code, stdout.text(), stderr.text()
 
     def _parse(self, raw: str) -> dict[str, object]:
-        parsed = json.loads(raw)
+        parsed = _fastjson.loads(raw)
         self.assertIsInstance(parsed, dict)
         return parsed
 
@@ -72,10 +116,12 @@ class JsonContractTests(unittest.TestCase):
         self.assertEqual(parsed["meta"]["schema_version"], "1")
 
     def test_send_sms_json_success_envelope(self):
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")), \
-                patch("send_sms.run_generated_json", return_value={"id": "msg-1", "message_status": "pending"}), \
-                patch("send_sms.require_api_key"):
+        with _patched(
+                patch("send_sms.require_generated_cli"),
+                patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")),
+                patch("send_sms.run_generated_json", return_value={"id": "msg-1", "message_status": "pending"}),
+                patch("send_sms.require_api_key"),
+        ):
             code, out, err = self._run(
                 send_sms,
                 ["bin/send_sms.py", "--to", "+14155550111", "--message", "hello", "--from", "+14155201316", "--json"],
@@ -91,10 +137,12 @@ class JsonContractTests(unittest.TestCase):
         self.assertEqual(parsed["data"]["delivery_status_raw"], "pending")
 
     def test_send_sms_json_success_envelope_status_fallback(self):
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")), \
-                patch("send_sms.run_generated_json", return_value={"id": "msg-2", "status": "pending"}), \
-                patch("send_sms.require_api_key"):
+        with _patched(
+                patch("send_sms.require_generated_cli"),
+                patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")),
+                patch("send_sms.run_generated_json", return_value={"id": "msg-2", "status": "pending"}),
+                patch("send_sms.require_api_key"),
+        ):
             code, out, err = self._run(
                 send_sms,
                 ["bin/send_sms.py", "--to", "+14155550111", "--message", "hello", "--from", "+14155201316", "--json"],
@@ -110,8 +158,10 @@ class JsonContractTests(unittest.TestCase):
         self.assertNotIn("message_status", parsed["data"])
 
     def test_send_sms_json_dry_run_omits_audit_when_unused(self):
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")):
+        with _patched(
+                patch("send_sms.require_generated_cli"),
+                patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")),
+        ):
             code, out, err = self._run(
                 send_sms,
                 [
@@ -361,10 +411,12 @@ class JsonContractTests(unittest.TestCase):
         self.assertEqual(parsed["error"]["code"], "invalid_argument")
 
     def test_make_call_json_success_envelope(self):
-        with patch("make_call.require_generated_cli"), \
-                patch("make_call.require_api_key"), \
-                patch("make_call.resolve_user_id", return_value="u1"), \
-                patch("make_call.run_generated_json", return_value={"call_id": "c1"}):
+        with _patched(
+                patch("make_call.require_generated_cli"),
+                patch("make_call.require_api_key"),
+                patch("make_call.resolve_user_id", return_value="u1"),
+                patch("make_call.run_generated_json", return_value={"call_id": "c1"}),
+        ):
             code, out, err = self._run(
                 make_call,
                 ["bin/make_call.py", "--to", "+14155550111", "--user-id", "u1", "--json"],
@@ -424,9 +476,11 @@ class JsonContractTests(unittest.TestCase):
                 return {"id": "ct-1"}
             raise AssertionError(cmd)
 
-        with patch("create_contact.require_generated_cli"), \
-                patch("create_contact.require_api_key"), \
-                patch("create_contact.run_generated_json", side_effect=fake_run):
+        with _patched(
+                patch("create_contact.require_generated_cli"),
+                patch("create_contact.require_api_key"),
+                patch("create_contact.run_generated_json", side_effect=fake_run),
+        ):
             code, out, err = self._run(
                 create_contact,
                 ["bin/create_contact.py", "--first-name", "A", "--last-name", "B", "--phone", "+14155550111", "--json"],
@@ -436,9 +490,11 @@ class JsonContractTests(unittest.TestCase):
         self._assert_success(self._parse(out), "create_contact.upsert")
 
     def test_update_contact_not_found_maps_to_not_found(self):
-        with patch("update_contact.require_generated_cli"), \
-                patch("update_contact.require_api_key"), \
-                patch("update_contact.run_generated_json", side_effect=WrapperError("404 Not Found")):
+        with _patched(
+                patch("update_contact.require_generated_cli"),
+                patch("update_contact.require_api_key"),
+                patch("update_contact.run_generated_json", side_effect=WrapperError("404 Not Found")),
+        ):
             code, out, err = self._run(
                 update_contact,
                 ["bin/update_contact.py", "--id", "missing", "--first-name", "A", "--json"],
@@ -450,9 +506,11 @@ class JsonContractTests(unittest.TestCase):
         self.assertEqual(parsed["error"]["code"], "not_found")
 
     def test_create_sms_webhook_subcommand_list_json(self):
-        with patch("create_sms_webhook.require_generated_cli"), \
-                patch("create_sms_webhook.require_api_key"), \
-                patch("create_sms_webhook.run_generated_json", return_value={"items": [{"id": "s1"}]}):
+        with _patched(
+                patch("create_sms_webhook.require_generated_cli"),
+                patch("create_sms_webhook.require_api_key"),
+                patch("create_sms_webhook.run_generated_json", return_value={"items": [{"id": "s1"}]}),
+        ):
             code, out, err = self._run(create_sms_webhook, ["bin/create_sms_webhook.py", "list", "--json"])
         self.assertEqual(code, 0)
         self.assertEqual(err, "")
@@ -467,18 +525,22 @@ class JsonContractTests(unittest.TestCase):
         self.assertEqual(parsed["error"]["code"], "invalid_argument")
 
     def test_create_sms_webhook_subcommand_delete_json(self):
-        with patch("create_sms_webhook.require_generated_cli"), \
-                patch("create_sms_webhook.require_api_key"), \
-                patch("create_sms_webhook.run_generated_json", return_value={"ok": True}):
+        with _patched(
+                patch("create_sms_webhook.require_generated_cli"),
+                patch("create_sms_webhook.require_api_key"),
+                patch("create_sms_webhook.run_generated_json", return_value={"ok": True}),
+        ):
             code, out, err = self._run(create_sms_webhook, ["bin/create_sms_webhook.py", "delete", "sub-1", "--json"])
         self.assertEqual(code, 0)
         self.assertEqual(err, "")
         self._assert_success(self._parse(out), "create_sms_webhook.delete")
 
     def test_create_sms_webhook_webhooks_list_json(self):
-        with patch("create_sms_webhook.require_generated_cli"), \
-                patch("create_sms_webhook.require_api_key"), \
-                patch("create_sms_webhook.run_generated_json", return_value={"items": [{"id": "w1"}]}):
+        with _patched(
+                patch("create_sms_webhook.require_generated_cli"),
+                patch("create_sms_webhook.require_api_key"),
+                patch("create_sms_webhook.run_generated_json", return_value={"items": [{"id": "w1"}]}),
+        ):
             code, out, err = self._run(create_sms_webhook, ["bin/create_sms_webhook.py", "webhooks", "list", "--json"])
         self.assertEqual(code, 0)
         self.assertEqual(err, "")
@@ -499,9 +561,11 @@ class JsonContractTests(unittest.TestCase):
                 return {"status": "complete", "download_url": "http://example.com/file.csv"}
             raise AssertionError(cmd)
 
-        with patch("export_sms.require_generated_cli"), \
-                patch("export_sms.require_api_key"), \
-                patch("export_sms.run_generated_json", side_effect=fake_run):
+        with _patched(
+                patch("export_sms.require_generated_cli"),
+                patch("export_sms.require_api_key"),
+                patch("export_sms.run_generated_json", side_effect=fake_run),
+        ):
             code, out, err = self._run(export_sms, ["bin/export_sms.py", "--json"])
         self.assertEqual(code, 0)
         self.assertEqual(err, "")
@@ -547,10 +611,12 @@ class JsonContractTests(unittest.TestCase):
         ])
 
     def test_export_sms_timeout_maps_to_timeout(self):
-        with patch("export_sms.require_generated_cli"), \
-                patch("export_sms.require_api_key"), \
-                patch("export_sms.run_generated_json", return_value={"request_id": "r1"}), \
-                patch("export_sms.poll_for_completion", side_effect=WrapperError("Timed out after 10 seconds")):
+        with _patched(
+                patch("export_sms.require_generated_cli"),
+                patch("export_sms.require_api_key"),
+                patch("export_sms.run_generated_json", return_value={"request_id": "r1"}),
+                patch("export_sms.poll_for_completion", side_effect=WrapperError("Timed out after 10 seconds")),
+        ):
             code, out, err = self._run(export_sms, ["bin/export_sms.py", "--json"])
         self.assertEqual(code, 2)
         self.assertEqual(err, "")
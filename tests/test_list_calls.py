@@ -1,22 +1,47 @@
-from pathlib import Path
 import json
 import sys
 import unittest
+from functools import lru_cache
 from unittest.mock import patch
 
-ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT / "scripts"))
+from _paths import ROOT, SCRIPTS
+
+sys.path.insert(0, str(SCRIPTS))
 sys.path.insert(0, str(ROOT))
 
 from list_calls import CALLS_ENDPOINT, fetch_calls, normalize_duration, to_call_summary
 
 
+# Canned API pages keyed by label. Encoding is deterministic per payload, so
+# _cached_bytes serializes each one once for the whole session no matter how
+# many responses (or tests) replay it.
+_PAYLOADS = {
+    "page1_answered": {
+        "items": [
+            {"state": "answered", "duration": 8000, "date_started": 1},
+        ],
+        "cursor": "next-page",
+    },
+    "page2_missed": {
+        "items": [
+            {"state": "missed", "duration": 0, "date_started": 2},
+        ],
+    },
+    "empty": {"items": []},
+}
+
+
+@lru_cache(maxsize=None)
+def _cached_bytes(payload_key):
+    return json.dumps(_PAYLOADS[payload_key]).encode("utf-8")
+
+
 class _FakeResponse:
-    def __init__(self, payload):
-        self._payload = payload
+    def __init__(self, payload_key):
+        self._key = payload_key
 
     def read(self):
-        return json.dumps(self._payload).encode("utf-8")
+        return _cached_bytes(self._key)
 
     def __enter__(self):
         return self
@@ -35,19 +60,7 @@ class ListCallsTests(unittest.TestCase):
         self.assertEqual(normalize_duration({"total_duration": 9000}), 9)
 
     def test_fetch_calls_applies_missed_filter_before_limit(self):
-        page1 = {
-            "items": [
-                {"state": "answered", "duration": 8000, "date_started": 1},
-            ],
-            "cursor": "next-page",
-        }
-        page2 = {
-            "items": [
-                {"state": "missed", "duration": 0, "date_started": 2},
-            ],
-        }
-
-        responses = [_FakeResponse(page1), _FakeResponse(page2)]
+        responses = [_FakeResponse("page1_answered"), _FakeResponse("page2_missed")]
 
         with patch("list_calls.urllib.request.urlopen", side_effect=responses):
             rows = fetch_calls(0, 999999, limit=1, missed_only=True)
@@ -60,7 +73,7 @@ class ListCallsTests(unittest.TestCase):
 
         def fake_urlopen(request):
             captured_headers["authorization"] = request.headers.get("Authorization")
-            return _FakeResponse({"items": []})
+            return _FakeResponse("empty")
 
         with patch.dict("list_calls.os.environ", {"DIALPAD_TOKEN": "token-only"}, clear=True), patch(
             "list_calls.urllib.request.urlopen",
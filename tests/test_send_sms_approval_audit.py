@@ -1,21 +1,38 @@
 from __future__ import annotations
 
 import io
-import json
 import sys
 import tempfile
 import unittest
 from argparse import Namespace
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import DEFAULT, patch
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bin"))
+from _paths import BIN
 
+sys.path.insert(0, str(BIN))
+
+import _fastjson
 import send_sms
 from _dialpad_compat import ERROR_CODES, WrapperError
 
 
+def _patch_send_sms():
+    """Patch the four send_sms seams through a single patch.multiple context.
+
+    One __enter__/__exit__ pair instead of four nested patch contexts; tests
+    configure the returned mocks dict before invoking main().
+    """
+    return patch.multiple(
+        "send_sms",
+        require_generated_cli=DEFAULT,
+        resolve_sender=DEFAULT,
+        run_generated_json=DEFAULT,
+        require_api_key=DEFAULT,
+    )
+
+
 class SendSmsApprovalAuditTests(unittest.TestCase):
     def _run(self, argv: list[str]) -> tuple[int, str, str]:
         with patch.object(sys, "argv", argv):
@@ -26,7 +43,7 @@ class SendSmsApprovalAuditTests(unittest.TestCase):
         return code, stdout.getvalue(), stderr.getvalue()
 
     def _parse(self, raw: str) -> dict[str, object]:
-        parsed = json.loads(raw)
+        parsed = _fastjson.loads(raw)
         self.assertIsInstance(parsed, dict)
         return parsed
 
@@ -61,10 +78,9 @@ class SendSmsApprovalAuditTests(unittest.TestCase):
                 patch.object(send_sms.sms_approval, "DB_PATH", Path(temp_dir) / "approvals.db"):
             draft = self._create_draft(temp_dir)
 
-            with patch("send_sms.require_generated_cli"), \
-                    patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")), \
-                    patch("send_sms.run_generated_json", return_value={"id": "msg-audit", "message_status": "pending"}), \
-                    patch("send_sms.require_api_key"):
+            with _patch_send_sms() as mocks:
+                mocks["resolve_sender"].return_value = ("+14155201316", "--from")
+                mocks["run_generated_json"].return_value = {"id": "msg-audit", "message_status": "pending"}
                 code, out, err = self._run(
                     [
                         "bin/send_sms.py",
@@ -108,10 +124,10 @@ class SendSmsApprovalAuditTests(unittest.TestCase):
                 patch.object(send_sms.sms_approval, "DB_PATH", Path(temp_dir) / "approvals.db"):
             draft = self._create_draft(temp_dir, draft_text="stored text")
 
-            with patch("send_sms.require_generated_cli"), \
-                    patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")), \
-                    patch("send_sms.run_generated_json") as run_generated_json, \
-                    patch("send_sms.require_api_key") as require_api_key:
+            with _patch_send_sms() as mocks:
+                mocks["resolve_sender"].return_value = ("+14155201316", "--from")
+                run_generated_json = mocks["run_generated_json"]
+                require_api_key = mocks["require_api_key"]
                 code, out, err = self._run(
                     [
                         "bin/send_sms.py",
@@ -136,7 +152,7 @@ class SendSmsApprovalAuditTests(unittest.TestCase):
             parsed = self._parse(out)
             self._assert_error(parsed)
             self.assertIn("draft_text_mismatch", parsed["error"]["message"])
-            serialized = json.dumps(parsed)
+            serialized = _fastjson.dumps(parsed)
             self.assertNotIn("stored text", serialized)
             self.assertNotIn("customer_number", serialized)
             self.assertNotIn("draft", parsed["meta"]["approval_audit"])
@@ -147,10 +163,10 @@ class SendSmsApprovalAuditTests(unittest.TestCase):
                 patch.object(send_sms.sms_approval, "DB_PATH", Path(temp_dir) / "approvals.db"):
             draft = self._create_draft(temp_dir, draft_text="stored text")
 
-            with patch("send_sms.require_generated_cli"), \
-                    patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")), \
-                    patch("send_sms.run_generated_json") as run_generated_json, \
-                    patch("send_sms.require_api_key") as require_api_key:
+            with _patch_send_sms() as mocks:
+                mocks["resolve_sender"].return_value = ("+14155201316", "--from")
+                run_generated_json = mocks["run_generated_json"]
+                require_api_key = mocks["require_api_key"]
                 code, out, err = self._run(
                     [
                         "bin/send_sms.py",
@@ -192,13 +208,11 @@ class SendSmsApprovalAuditTests(unittest.TestCase):
                 patch.object(send_sms.sms_approval, "DB_PATH", Path(temp_dir) / "approvals.db"):
             draft = self._create_draft(temp_dir)
 
-            with patch("send_sms.require_generated_cli"), \
-                    patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")), \
-                    patch(
-                        "send_sms.run_generated_json",
-                        side_effect=WrapperError("Dialpad unavailable", code="upstream_error", retryable=True),
-                    ), \
-                    patch("send_sms.require_api_key"):
+            with _patch_send_sms() as mocks:
+                mocks["resolve_sender"].return_value = ("+14155201316", "--from")
+                mocks["run_generated_json"].side_effect = WrapperError(
+                    "Dialpad unavailable", code="upstream_error", retryable=True
+                )
                 code, out, err = self._run(
                     [
                         "bin/send_sms.py",
@@ -230,10 +244,10 @@ class SendSmsApprovalAuditTests(unittest.TestCase):
             self.assertEqual(stored["send_error"], "Dialpad unavailable")
 
     def test_audited_direct_send_requires_actor(self):
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.resolve_sender", return_value=("+14155201316", "--from")), \
-                patch("send_sms.run_generated_json") as run_generated_json, \
-                patch("send_sms.require_api_key") as require_api_key:
+        with _patch_send_sms() as mocks:
+            mocks["resolve_sender"].return_value = ("+14155201316", "--from")
+            run_generated_json = mocks["run_generated_json"]
+            require_api_key = mocks["require_api_key"]
             code, out, err = self._run(
                 [
                     "bin/send_sms.py",
@@ -1,40 +1,67 @@
 from __future__ import annotations
 
 import io
-import json
 import sys
 import tempfile
 import unittest
-from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
-from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bin"))
+from _paths import BIN
+
+sys.path.insert(0, str(BIN))
 
 import send_sms
 from _dialpad_compat import WrapperError
+import _fastjson
+from _patching import Recorder, assert_all_in, envpatch, monkey, noop
 import send_group_intro
 
 
+def _raise_cli_missing(*_args, **_kwargs):
+    raise WrapperError("Generated CLI not found at /tmp/generated/dialpad")
+
+
+def _recording_fake(calls, payloads, result):
+    """Fake run_generated_json that decodes each JSON payload as it is
+    recorded, so assertions read the parsed dict instead of re-running
+    json.loads on the captured argv strings."""
+
+    def fake_run_generated(cmd: list[str]):
+        calls.append(cmd)
+        payloads.append(_fastjson.loads(cmd[3]) if len(cmd) > 3 else None)
+        return result(len(calls)) if callable(result) else result
+
+    return fake_run_generated
+
+
 class SendSmsWrapperTests(unittest.TestCase):
     def _run_main(self, module, args):
-        with patch.object(sys, "argv", ["bin/send_sms.py", *args]):
-            stdout = io.StringIO()
-            stderr = io.StringIO()
-            with redirect_stdout(stdout), redirect_stderr(stderr):
-                code = module.main()
+        # Direct argv/stream swap: this helper runs once per test, and the
+        # redirect_* context managers add four Python-level enter/exit calls
+        # each time for what is a pair of attribute assignments.
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        old_argv, old_stdout, old_stderr = sys.argv, sys.stdout, sys.stderr
+        sys.argv = ["bin/send_sms.py", *args]
+        sys.stdout, sys.stderr = stdout, stderr
+        try:
+            code = module.main()
+        finally:
+            sys.argv, sys.stdout, sys.stderr = old_argv, old_stdout, old_stderr
         return code, stdout.getvalue(), stderr.getvalue()
 
     def test_send_sms_requires_sender_without_flags_or_env(self):
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key"), \
-                patch.dict("os.environ", {
-                    "DIALPAD_DEFAULT_PROFILE": "",
-                    "DIALPAD_DEFAULT_FROM_NUMBER": "",
-                    "DIALPAD_PROFILE_WORK_FROM": "",
-                    "DIALPAD_PROFILE_SALES_FROM": "",
-                }, clear=False), \
-                patch("send_sms.run_generated_json"):
+        with envpatch(
+                    DIALPAD_DEFAULT_PROFILE="",
+                    DIALPAD_DEFAULT_FROM_NUMBER="",
+                    DIALPAD_PROFILE_WORK_FROM="",
+                    DIALPAD_PROFILE_SALES_FROM="",
+                ), \
+                monkey(
+                    (send_sms, "require_generated_cli", noop),
+                    (send_sms, "require_api_key", noop),
+                    (send_sms, "run_generated_json", noop),
+                ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+14155550111",
                 "--message", "Hello",
@@ -42,20 +69,19 @@ class SendSmsWrapperTests(unittest.TestCase):
 
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
-        self.assertIn("No sender resolved", err)
-        self.assertIn("Provide --from", err)
+        assert_all_in(["No sender resolved", "Provide --from"], err)
 
     def test_send_sms_resolves_profile_mapping(self):
         calls: list[list[str]] = []
-
-        def fake_run_generated(cmd: list[str]):
-            calls.append(cmd)
-            return {"id": "msg-1", "status": "pending"}
-
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key"), \
-                patch.dict("os.environ", {"DIALPAD_PROFILE_WORK_FROM": "+14153602954"}, clear=False), \
-                patch("send_sms.run_generated_json", side_effect=fake_run_generated):
+        payloads: list[dict] = []
+        fake_run_generated = _recording_fake(calls, payloads, {"id": "msg-1", "status": "pending"})
+
+        with envpatch(DIALPAD_PROFILE_WORK_FROM="+14153602954"), \
+                monkey(
+                    (send_sms, "require_generated_cli", noop),
+                    (send_sms, "require_api_key", noop),
+                    (send_sms, "run_generated_json", fake_run_generated),
+                ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+14155550111",
                 "--profile", "work",
@@ -65,14 +91,15 @@ class SendSmsWrapperTests(unittest.TestCase):
         self.assertEqual(code, 0)
         self.assertEqual(err, "")
         self.assertIn("Selected sender: +14153602954", out)
-        payload = json.loads(calls[0][3])
-        self.assertEqual(payload["from_number"], "+14153602954")
+        self.assertEqual(payloads[0]["from_number"], "+14153602954")
 
     def test_send_sms_profile_requires_configured_sender(self):
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key"), \
-                patch.dict("os.environ", {"DIALPAD_PROFILE_WORK_FROM": ""}, clear=False), \
-                patch("send_sms.run_generated_json"):
+        with envpatch(DIALPAD_PROFILE_WORK_FROM=""), \
+                monkey(
+                    (send_sms, "require_generated_cli", noop),
+                    (send_sms, "require_api_key", noop),
+                    (send_sms, "run_generated_json", noop),
+                ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+14155550111",
                 "--profile", "work",
@@ -84,10 +111,12 @@ class SendSmsWrapperTests(unittest.TestCase):
         self.assertIn("Profile 'work' is not configured", err)
 
     def test_send_sms_rejects_invalid_default_from_number(self):
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key"), \
-                patch.dict("os.environ", {"DIALPAD_DEFAULT_FROM_NUMBER": "not-a-number"}, clear=False), \
-                patch("send_sms.run_generated_json"):
+        with envpatch(DIALPAD_DEFAULT_FROM_NUMBER="not-a-number"), \
+                monkey(
+                    (send_sms, "require_generated_cli", noop),
+                    (send_sms, "require_api_key", noop),
+                    (send_sms, "run_generated_json", noop),
+                ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+14155550111",
                 "--message", "Hello",
@@ -98,10 +127,12 @@ class SendSmsWrapperTests(unittest.TestCase):
         self.assertIn("Invalid sender number", err)
 
     def test_send_sms_conflict_between_from_and_profile(self):
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key"), \
-                patch.dict("os.environ", {"DIALPAD_PROFILE_WORK_FROM": "+14153602954"}, clear=False), \
-                patch("send_sms.run_generated_json"):
+        with envpatch(DIALPAD_PROFILE_WORK_FROM="+14153602954"), \
+                monkey(
+                    (send_sms, "require_generated_cli", noop),
+                    (send_sms, "require_api_key", noop),
+                    (send_sms, "run_generated_json", noop),
+                ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+14155550111",
                 "--from", "+14155201316",
@@ -115,15 +146,17 @@ class SendSmsWrapperTests(unittest.TestCase):
 
     def test_send_sms_allows_profile_conflict_with_override(self):
         calls: list[list[str]] = []
-
-        def fake_run_generated(cmd: list[str]):
-            calls.append(cmd)
-            return {"id": "msg-1", "message_status": "pending"}
-
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key"), \
-                patch.dict("os.environ", {"DIALPAD_PROFILE_WORK_FROM": "+14153602954"}, clear=False), \
-                patch("send_sms.run_generated_json", side_effect=fake_run_generated):
+        payloads: list[dict] = []
+        fake_run_generated = _recording_fake(
+            calls, payloads, {"id": "msg-1", "message_status": "pending"}
+        )
+
+        with envpatch(DIALPAD_PROFILE_WORK_FROM="+14153602954"), \
+                monkey(
+                    (send_sms, "require_generated_cli", noop),
+                    (send_sms, "require_api_key", noop),
+                    (send_sms, "run_generated_json", fake_run_generated),
+                ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+14155550111",
                 "--from", "+14155201316",
@@ -134,8 +167,7 @@ class SendSmsWrapperTests(unittest.TestCase):
 
         self.assertEqual(code, 0)
         self.assertEqual(err, "")
-        payload = json.loads(calls[0][3])
-        self.assertEqual(payload["from_number"], "+14155201316")
+        self.assertEqual(payloads[0]["from_number"], "+14155201316")
         self.assertIn("Selected sender: +14155201316", out)
 
     def test_send_sms_reports_accepted_queued_for_pending_result(self):
@@ -143,9 +175,11 @@ class SendSmsWrapperTests(unittest.TestCase):
             self.assertEqual(cmd[:2], ["sms", "send"])
             return {"id": "msg-1", "message_status": "pending"}
 
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key"), \
-                patch("send_sms.run_generated_json", side_effect=fake_run_generated):
+        with monkey(
+                (send_sms, "require_generated_cli", noop),
+                (send_sms, "require_api_key", noop),
+                (send_sms, "run_generated_json", fake_run_generated),
+        ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+14155550111",
                 "--from", "+14155201316",
@@ -158,9 +192,13 @@ class SendSmsWrapperTests(unittest.TestCase):
         self.assertNotIn("Status: pending\n", out)
 
     def test_send_sms_dry_run_does_not_call_api(self):
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key") as require_key, \
-                patch("send_sms.run_generated_json") as run_json:
+        require_key = Recorder()
+        run_json = Recorder()
+        with monkey(
+                (send_sms, "require_generated_cli", noop),
+                (send_sms, "require_api_key", require_key),
+                (send_sms, "run_generated_json", run_json),
+        ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+14155550111",
                 "--from", "+14155201316",
@@ -172,16 +210,25 @@ class SendSmsWrapperTests(unittest.TestCase):
         self.assertEqual(err, "")
         self.assertEqual(require_key.call_count, 0)
         self.assertEqual(run_json.call_count, 0)
-        self.assertIn("Dry run: SMS not sent", out)
-        self.assertIn("Selected sender: +14155201316", out)
-        self.assertIn("Message source: --message", out)
-        self.assertIn("Message preview:", out)
-        self.assertIn("Hello", out)
+        assert_all_in(
+            [
+                "Dry run: SMS not sent",
+                "Selected sender: +14155201316",
+                "Message source: --message",
+                "Message preview:",
+                "Hello",
+            ],
+            out,
+        )
 
     def test_send_sms_rejects_non_nanp_recipient_before_api(self):
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key") as require_key, \
-                patch("send_sms.run_generated_json") as run_json:
+        require_key = Recorder()
+        run_json = Recorder()
+        with monkey(
+                (send_sms, "require_generated_cli", noop),
+                (send_sms, "require_api_key", require_key),
+                (send_sms, "run_generated_json", run_json),
+        ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+442071838750",
                 "--from", "+14155201316",
@@ -191,13 +238,18 @@ class SendSmsWrapperTests(unittest.TestCase):
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
         self.assertIn("NANP", err)
-        require_key.assert_not_called()
-        run_json.assert_not_called()
+        self.assertEqual(require_key.call_count, 0)
+        self.assertEqual(run_json.call_count, 0)
 
     def test_send_sms_json_rejection_is_non_retryable_invalid_argument(self):
-        with patch("send_sms.require_generated_cli") as require_cli, \
-                patch("send_sms.require_api_key") as require_key, \
-                patch("send_sms.run_generated_json") as run_json:
+        require_cli = Recorder()
+        require_key = Recorder()
+        run_json = Recorder()
+        with monkey(
+                (send_sms, "require_generated_cli", require_cli),
+                (send_sms, "require_api_key", require_key),
+                (send_sms, "run_generated_json", run_json),
+        ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+442071838750",
                 "--from", "+14155201316",
@@ -205,26 +257,28 @@ class SendSmsWrapperTests(unittest.TestCase):
                 "--json",
             ])
 
-        envelope = json.loads(out)
+        envelope = _fastjson.loads(out)
         self.assertEqual(code, 2)
         self.assertEqual(err, "")
         self.assertFalse(envelope["ok"])
         self.assertEqual(envelope["error"]["code"], "invalid_argument")
         self.assertFalse(envelope["error"]["retryable"])
-        require_cli.assert_not_called()
-        require_key.assert_not_called()
-        run_json.assert_not_called()
+        self.assertEqual(require_cli.call_count, 0)
+        self.assertEqual(require_key.call_count, 0)
+        self.assertEqual(run_json.call_count, 0)
 
     def test_send_sms_preserves_nanp_country_inference_contract(self):
         calls: list[list[str]] = []
-
-        with patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key"), \
-                patch(
-                    "send_sms.run_generated_json",
-                    side_effect=lambda command: calls.append(command)
-                    or {"id": "msg-1", "message_status": "pending"},
-                ):
+        payloads: list[dict] = []
+        fake_run_generated = _recording_fake(
+            calls, payloads, {"id": "msg-1", "message_status": "pending"}
+        )
+
+        with monkey(
+                (send_sms, "require_generated_cli", noop),
+                (send_sms, "require_api_key", noop),
+                (send_sms, "run_generated_json", fake_run_generated),
+        ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "4155550100",
                 "--from", "+14155201316",
@@ -235,26 +289,27 @@ class SendSmsWrapperTests(unittest.TestCase):
 
         self.assertEqual(code, 0)
         self.assertEqual(err, "")
-        self.assertTrue(json.loads(out)["ok"])
-        payload = json.loads(calls[0][3])
-        self.assertEqual(payload["to_numbers"], ["+14155550100"])
-        self.assertTrue(payload["infer_country_code"])
+        self.assertTrue(_fastjson.loads(out)["ok"])
+        self.assertEqual(payloads[0]["to_numbers"], ["+14155550100"])
+        self.assertTrue(payloads[0]["infer_country_code"])
 
     def test_send_sms_message_file_preserves_dollar_sign_in_payload(self):
         calls: list[list[str]] = []
-
-        def fake_run_generated(cmd: list[str]):
-            calls.append(cmd)
-            return {"id": "msg-1", "message_status": "pending"}
+        payloads: list[dict] = []
+        fake_run_generated = _recording_fake(
+            calls, payloads, {"id": "msg-1", "message_status": "pending"}
+        )
 
         with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False) as tmp:
             tmp.write("The premium hardshell travel case is $499.")
             message_path = tmp.name
 
         try:
-            with patch("send_sms.require_generated_cli"), \
-                    patch("send_sms.require_api_key"), \
-                    patch("send_sms.run_generated_json", side_effect=fake_run_generated):
+            with monkey(
+                    (send_sms, "require_generated_cli", noop),
+                    (send_sms, "require_api_key", noop),
+                    (send_sms, "run_generated_json", fake_run_generated),
+            ):
                 code, out, err = self._run_main(send_sms, [
                     "--to", "+14155550111",
                     "--from", "+14155201316",
@@ -265,15 +320,18 @@ class SendSmsWrapperTests(unittest.TestCase):
 
         self.assertEqual(code, 0)
         self.assertEqual(err, "")
-        payload = json.loads(calls[0][3])
-        self.assertEqual(payload["text"], "The premium hardshell travel case is $499.")
+        self.assertEqual(payloads[0]["text"], "The premium hardshell travel case is $499.")
         self.assertIn("Selected sender: +14155201316", out)
 
     def test_send_sms_message_stdin_dry_run_shows_exact_message(self):
-        with patch.object(sys, "stdin", io.StringIO("It's $499 typically.")), \
-                patch("send_sms.require_generated_cli"), \
-                patch("send_sms.require_api_key") as require_key, \
-                patch("send_sms.run_generated_json") as run_json:
+        require_key = Recorder()
+        run_json = Recorder()
+        with monkey(
+                (sys, "stdin", io.StringIO("It's $499 typically.")),
+                (send_sms, "require_generated_cli", noop),
+                (send_sms, "require_api_key", require_key),
+                (send_sms, "run_generated_json", run_json),
+        ):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+14155550111",
                 "--from", "+14155201316",
@@ -285,8 +343,7 @@ class SendSmsWrapperTests(unittest.TestCase):
         self.assertEqual(err, "")
         self.assertEqual(require_key.call_count, 0)
         self.assertEqual(run_json.call_count, 0)
-        self.assertIn("Message source: --message-stdin", out)
-        self.assertIn("It's $499 typically.", out)
+        assert_all_in(["Message source: --message-stdin", "It's $499 typically."], out)
 
     def test_send_sms_rejects_non_utf8_message_file(self):
         with tempfile.NamedTemporaryFile("wb", delete=False) as tmp:
@@ -294,9 +351,11 @@ class SendSmsWrapperTests(unittest.TestCase):
             message_path = tmp.name
 
         try:
-            with patch("send_sms.require_generated_cli"), \
-                    patch("send_sms.require_api_key"), \
-                    patch("send_sms.run_generated_json"):
+            with monkey(
+                    (send_sms, "require_generated_cli", noop),
+                    (send_sms, "require_api_key", noop),
+                    (send_sms, "run_generated_json", noop),
+            ):
                 code, out, err = self._run_main(send_sms, [
                     "--to", "+14155550111",
                     "--from", "+14155201316",
@@ -315,9 +374,11 @@ class SendSmsWrapperTests(unittest.TestCase):
             message_path = tmp.name
 
         try:
-            with patch("send_sms.require_generated_cli"), \
-                    patch("send_sms.require_api_key"), \
-                    patch("send_sms.run_generated_json"):
+            with monkey(
+                    (send_sms, "require_generated_cli", noop),
+                    (send_sms, "require_api_key", noop),
+                    (send_sms, "run_generated_json", noop),
+            ):
                 code, out, err = self._run_main(send_sms, [
                     "--to", "+14155550111",
                     "--from", "+14155201316",
@@ -331,10 +392,7 @@ class SendSmsWrapperTests(unittest.TestCase):
         self.assertIn("Message text from --message-file", err)
 
     def test_send_sms_fails_when_generated_cli_unavailable(self):
-        with patch(
-            "send_sms.require_generated_cli",
-            side_effect=WrapperError("Generated CLI not found at /tmp/generated/dialpad"),
-        ):
+        with monkey((send_sms, "require_generated_cli", _raise_cli_missing)):
             code, out, err = self._run_main(send_sms, [
                 "--to", "+14155550111",
                 "--message", "Hello",
@@ -348,16 +406,22 @@ class SendSmsWrapperTests(unittest.TestCase):
 
 class SendGroupIntroTests(unittest.TestCase):
     def _run_main(self, args):
-        with patch.object(sys, "argv", ["bin/send_group_intro.py", *args]):
-            stdout = io.StringIO()
-            stderr = io.StringIO()
-            with redirect_stdout(stdout), redirect_stderr(stderr):
-                code = send_group_intro.main()
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        old_argv, old_stdout, old_stderr = sys.argv, sys.stdout, sys.stderr
+        sys.argv = ["bin/send_group_intro.py", *args]
+        sys.stdout, sys.stderr = stdout, stderr
+        try:
+            code = send_group_intro.main()
+        finally:
+            sys.argv, sys.stdout, sys.stderr = old_argv, old_stdout, old_stderr
         return code, stdout.getvalue(), stderr.getvalue()
 
     def test_send_group_intro_requires_confirm_share(self):
-        with patch("send_group_intro.require_generated_cli"), \
-                patch("send_group_intro.require_api_key"):
+        with monkey(
+                (send_group_intro, "require_generated_cli", noop),
+                (send_group_intro, "require_api_key", noop),
+        ):
             code, out, err = self._run_main([
                 "--prospect", "+14155550111",
                 "--reference", "+14155559999",
@@ -370,9 +434,13 @@ class SendGroupIntroTests(unittest.TestCase):
         self.assertIn("without --confirm-share", err)
 
     def test_send_group_intro_dry_run_outputs_structure(self):
-        with patch("send_group_intro.require_generated_cli"), \
-                patch("send_group_intro.require_api_key") as require_key, \
-                patch("send_group_intro.run_generated_json") as run_json:
+        require_key = Recorder()
+        run_json = Recorder()
+        with monkey(
+                (send_group_intro, "require_generated_cli", noop),
+                (send_group_intro, "require_api_key", require_key),
+                (send_group_intro, "run_generated_json", run_json),
+        ):
             code, out, err = self._run_main([
                 "--prospect", "+14155550111",
                 "--reference", "+14155559999",
@@ -386,7 +454,7 @@ class SendGroupIntroTests(unittest.TestCase):
         self.assertEqual(err, "")
         self.assertEqual(require_key.call_count, 0)
         self.assertEqual(run_json.call_count, 0)
-        parsed = json.loads(out)
+        parsed = _fastjson.loads(out)
         self.assertTrue(parsed["ok"])
         self.assertEqual(parsed["command"], "send_group_intro.send")
         self.assertEqual(parsed["data"]["mode"], "mirrored_fallback")
@@ -395,10 +463,14 @@ class SendGroupIntroTests(unittest.TestCase):
         self.assertEqual(parsed["data"]["reference"]["to"], "+14155559999")
 
     def test_send_group_intro_rejects_non_nanp_party_before_api(self):
-        with patch("send_group_intro.require_generated_cli"), \
-                patch("send_group_intro.resolve_sender", return_value=("+14155201316", "--from")), \
-                patch("send_group_intro.require_api_key") as require_key, \
-                patch("send_group_intro.run_generated_json") as run_json:
+        require_key = Recorder()
+        run_json = Recorder()
+        with monkey(
+                (send_group_intro, "require_generated_cli", noop),
+                (send_group_intro, "resolve_sender", Recorder(result=("+14155201316", "--from"))),
+                (send_group_intro, "require_api_key", require_key),
+                (send_group_intro, "run_generated_json", run_json),
+        ):
             code, out, err = self._run_main([
                 "--prospect", "+14155550111",
                 "--reference", "+442071838750",
@@ -408,13 +480,18 @@ class SendGroupIntroTests(unittest.TestCase):
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
         self.assertIn("NANP", err)
-        require_key.assert_not_called()
-        run_json.assert_not_called()
+        self.assertEqual(require_key.call_count, 0)
+        self.assertEqual(run_json.call_count, 0)
 
     def test_send_group_intro_json_rejection_is_non_retryable_invalid_argument(self):
-        with patch("send_group_intro.require_generated_cli") as require_cli, \
-                patch("send_group_intro.require_api_key") as require_key, \
-                patch("send_group_intro.run_generated_json") as run_json:
+        require_cli = Recorder()
+        require_key = Recorder()
+        run_json = Recorder()
+        with monkey(
+                (send_group_intro, "require_generated_cli", require_cli),
+                (send_group_intro, "require_api_key", require_key),
+                (send_group_intro, "run_generated_json", run_json),
+        ):
             code, out, err = self._run_main([
                 "--prospect", "+14155550111",
                 "--reference", "+442071838750",
@@ -422,28 +499,30 @@ class SendGroupIntroTests(unittest.TestCase):
                 "--json",
             ])
 
-        envelope = json.loads(out)
+        envelope = _fastjson.loads(out)
         self.assertEqual(code, 2)
         self.assertEqual(err, "")
         self.assertFalse(envelope["ok"])
         self.assertEqual(envelope["error"]["code"], "invalid_argument")
         self.assertFalse(envelope["error"]["retryable"])
-        require_cli.assert_not_called()
-        require_key.assert_not_called()
-        run_json.assert_not_called()
+        self.assertEqual(require_cli.call_count, 0)
+        self.assertEqual(require_key.call_count, 0)
+        self.assertEqual(run_json.call_count, 0)
 
     def test_send_group_intro_success_sends_two_messages(self):
         calls: list[list[str]] = []
-
-        def fake_run_generated(cmd: list[str]):
-            calls.append(cmd)
-            if len(calls) == 1:
-                return {"id": "prospect-msg", "message_status": "pending"}
-            return {"id": "reference-msg", "message_status": "pending"}
-
-        with patch("send_group_intro.require_generated_cli"), \
-                patch("send_group_intro.require_api_key"), \
-                patch("send_group_intro.run_generated_json", side_effect=fake_run_generated):
+        payloads: list[dict] = []
+        fake_run_generated = _recording_fake(
+            calls,
+            payloads,
+            lambda n: {"id": "prospect-msg" if n == 1 else "reference-msg", "message_status": "pending"},
+        )
+
+        with monkey(
+                (send_group_intro, "require_generated_cli", noop),
+                (send_group_intro, "require_api_key", noop),
+                (send_group_intro, "run_generated_json", fake_run_generated),
+        ):
             code, out, err = self._run_main([
                 "--prospect", "+14155550111",
                 "--reference", "+14155559999",
@@ -457,13 +536,11 @@ class SendGroupIntroTests(unittest.TestCase):
         self.assertEqual(len(calls), 2)
         self.assertEqual(calls[0][:2], ["sms", "send"])
         self.assertEqual(calls[1][:2], ["sms", "send"])
-        payload_a = json.loads(calls[0][3])
-        payload_b = json.loads(calls[1][3])
-        self.assertEqual(payload_a["to_numbers"], ["+14155550111"])
-        self.assertEqual(payload_b["to_numbers"], ["+14155559999"])
-        self.assertEqual(payload_a["from_number"], "+14155201316")
-        self.assertEqual(payload_b["from_number"], "+14155201316")
-        parsed = json.loads(out)
+        self.assertEqual(payloads[0]["to_numbers"], ["+14155550111"])
+        self.assertEqual(payloads[1]["to_numbers"], ["+14155559999"])
+        self.assertEqual(payloads[0]["from_number"], "+14155201316")
+        self.assertEqual(payloads[1]["from_number"], "+14155201316")
+        parsed = _fastjson.loads(out)
         self.assertTrue(parsed["ok"])
         self.assertEqual(parsed["command"], "send_group_intro.send")
         self.assertEqual(parsed["data"]["mode"], "mirrored_fallback")
@@ -479,9 +556,11 @@ class SendGroupIntroTests(unittest.TestCase):
                 return {"id": "prospect-msg", "message_status": "pending"}
             raise WrapperError("Boom")
 
-        with patch("send_group_intro.require_generated_cli"), \
-                patch("send_group_intro.require_api_key"), \
-                patch("send_group_intro.run_generated_json", side_effect=fake_run_generated):
+        with monkey(
+                (send_group_intro, "require_generated_cli", noop),
+                (send_group_intro, "require_api_key", noop),
+                (send_group_intro, "run_generated_json", fake_run_generated),
+        ):
             code, out, err = self._run_main([
                 "--prospect", "+14155550111",
                 "--reference", "+14155559999",
@@ -492,14 +571,10 @@ class SendGroupIntroTests(unittest.TestCase):
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
         self.assertEqual(len(calls), 2)
-        self.assertIn("first_message_id=prospect-msg", err)
-        self.assertIn("partial success", err.lower())
+        assert_all_in(["first_message_id=prospect-msg", "partial success"], err.lower())
 
     def test_send_group_intro_fails_when_generated_cli_unavailable(self):
-        with patch(
-            "send_group_intro.require_generated_cli",
-            side_effect=WrapperError("Generated CLI not found at /tmp/generated/dialpad"),
-        ):
+        with monkey((send_group_intro, "require_generated_cli", _raise_cli_missing)):
             code, out, err = self._run_main([
                 "--prospect", "+14155550111",
                 "--reference", "+14155559999",
@@ -1,24 +1,55 @@
-from pathlib import Path
 import io
 import json
 import sys
 import unittest
-from contextlib import redirect_stderr, redirect_stdout
-from unittest.mock import patch
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bin"))
+from _paths import BIN
+
+sys.path.insert(0, str(BIN))
 
 import update_contact
 from _dialpad_compat import WrapperError
 
 
 class UpdateContactTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Deferred: mock's transitive imports only load when this class runs
+        # standalone; under the full suite another module has already paid it.
+        from unittest.mock import patch
+
+        # One patch stack for the whole class; MagicMock construction and
+        # patch enter/exit bookkeeping run once instead of per test.
+        cls._patchers = [
+            patch("update_contact.require_generated_cli"),
+            patch("update_contact.require_api_key"),
+            patch("update_contact.run_generated_json"),
+        ]
+        cls.require_cli, cls.require_key, cls.run_json = (
+            patcher.start() for patcher in cls._patchers
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        for patcher in cls._patchers:
+            patcher.stop()
+
+    def setUp(self):
+        for mock in (self.require_cli, self.require_key, self.run_json):
+            mock.reset_mock(return_value=True, side_effect=True)
+
     def _run_main(self, args):
-        with patch.object(sys, "argv", ["bin/update_contact.py", *args]):
-            stdout = io.StringIO()
-            stderr = io.StringIO()
-            with redirect_stdout(stdout), redirect_stderr(stderr):
-                code = update_contact.main()
+        # Direct argv/stream swap; cheaper than patch.object plus two
+        # redirect_* context managers for a helper every test goes through.
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        old_argv, old_stdout, old_stderr = sys.argv, sys.stdout, sys.stderr
+        sys.argv = ["bin/update_contact.py", *args]
+        sys.stdout, sys.stderr = stdout, stderr
+        try:
+            code = update_contact.main()
+        finally:
+            sys.argv, sys.stdout, sys.stderr = old_argv, old_stdout, old_stderr
         return code, stdout.getvalue(), stderr.getvalue()
 
     def test_update_contact_success(self):
@@ -30,16 +61,14 @@ class UpdateContactTests(unittest.TestCase):
                 return {"id": "contact-999"}
             raise AssertionError(f"Unexpected command: {cmd}")
 
-        with patch("update_contact.require_generated_cli"), \
-                patch("update_contact.require_api_key"), \
-                patch("update_contact.run_generated_json", side_effect=fake_run_generated):
-            code, out, err = self._run_main([
-                "--id", "contact-999",
-                "--first-name", "Jane",
-                "--email", "jane@example.com",
-                "--phone", "+14155550123",
-                "--url", "https://example.com",
-            ])
+        self.run_json.side_effect = fake_run_generated
+        code, out, err = self._run_main([
+            "--id", "contact-999",
+            "--first-name", "Jane",
+            "--email", "jane@example.com",
+            "--phone", "+14155550123",
+            "--url", "https://example.com",
+        ])
 
         self.assertEqual(code, 0)
         self.assertIn("Updated contact contact-999:", out)
@@ -51,49 +80,40 @@ class UpdateContactTests(unittest.TestCase):
         self.assertEqual(payload["phones"], ["+14155550123"])
 
     def test_update_contact_not_found(self):
-        with patch("update_contact.require_generated_cli"), \
-                patch("update_contact.require_api_key"), \
-                patch("update_contact.run_generated_json", side_effect=WrapperError("404 Not Found")):
-            code, out, err = self._run_main([
-                "--id", "contact-missing",
-                "--first-name", "Missing",
-            ])
+        self.run_json.side_effect = WrapperError("404 Not Found")
+        code, out, err = self._run_main([
+            "--id", "contact-missing",
+            "--first-name", "Missing",
+        ])
 
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
         self.assertIn("Error: Contact not found: contact-missing", err)
 
     def test_update_contact_rejects_missing_fields(self):
-        with patch("update_contact.require_generated_cli"), \
-                patch("update_contact.require_api_key"), \
-                patch("update_contact.run_generated_json"):
-            code, out, err = self._run_main(["--id", "contact-1"])
+        code, out, err = self._run_main(["--id", "contact-1"])
 
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
         self.assertIn("No update fields provided", err)
 
-        with patch("update_contact.require_generated_cli"), \
-                patch("update_contact.require_api_key"), \
-                patch("update_contact.run_generated_json"):
-            code, out, err = self._run_main([
-                "--id", "contact-1",
-                "--phone", "123",
-            ])
+        code, out, err = self._run_main([
+            "--id", "contact-1",
+            "--phone", "123",
+        ])
 
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
         self.assertIn("Invalid --phone", err)
 
     def test_update_contact_fails_when_generated_cli_unavailable(self):
-        with patch(
-            "update_contact.require_generated_cli",
-            side_effect=WrapperError("Generated CLI not found at /tmp/generated/dialpad"),
-        ):
-            code, out, err = self._run_main([
-                "--id", "contact-1",
-                "--first-name", "Jane",
-            ])
+        self.require_cli.side_effect = WrapperError(
+            "Generated CLI not found at /tmp/generated/dialpad"
+        )
+        code, out, err = self._run_main([
+            "--id", "contact-1",
+            "--first-name", "Jane",
+        ])
 
         self.assertEqual(code, 2)
         self.assertEqual(out, "")
